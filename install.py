@@ -18,8 +18,16 @@ from pathlib import Path
 # Add lib to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
 
-from lib.common import colors, print_error, print_success, print_warning, print_info
-from lib.symlinks import create_link
+from lib.common import (
+    colors, print_error, print_success, print_warning, print_info, write_text_atomic
+)
+from lib.symlinks import create_link, present
+
+# Per-user locations, resolved once at import
+HOME = Path.home()
+CURSOR_COMMANDS_DIR = HOME / '.cursor' / 'commands'
+GEMINI_PROMPTS_DIR = HOME / '.config' / 'gemini' / 'prompts'
+GEMINI_HOME = HOME / '.gemini'
 
 
 def is_windows() -> bool:
@@ -29,7 +37,7 @@ def is_windows() -> bool:
 
 def get_install_dir() -> Path:
     """Get installation directory path."""
-    return Path.home() / '.agentsmd'
+    return HOME / '.agentsmd'
 
 
 def get_script_dir() -> Path:
@@ -283,7 +291,7 @@ def add_to_path_unix(bin_dir: Path) -> bool:
     Returns:
         True if successful
     """
-    home = Path.home()
+    home = HOME
     
     # Detect shell config file
     shell_config = None
@@ -367,21 +375,37 @@ if ($path -notlike "*{bin_dir}*") {{
         return True
 
 
-def ensure_inquirer():
-    """Auto-install inquirer if missing."""
-    try:
-        import inquirer
-        return inquirer
-    except ImportError:
-        print_info("📦 Installing required dependency: inquirer...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "inquirer"])
-            import inquirer
-            return inquirer
-        except Exception as e:
-            print_warning(f"⚠️  Could not install inquirer: {e}")
-            print_info("Agent configuration will be skipped")
-            return None
+def simple_checkbox(message: str, choices: list) -> list:
+    """Prompt for a multi-selection from a numbered list.
+    
+    Args:
+        message: Prompt shown above the choices
+        choices: Option labels
+        
+    Returns:
+        Selected labels in menu order (empty if none)
+    """
+    print(message)
+    for index, choice in enumerate(choices, 1):
+        print(f"  {index}. {choice}")
+    
+    while True:
+        response = input("Enter numbers separated by commas ('a' for all, blank for none): ").strip().lower()
+        if not response:
+            return []
+        if response == 'a':
+            return list(choices)
+        
+        picked = set()
+        for token in response.replace(' ', ',').split(','):
+            if not token:
+                continue
+            if not token.isdigit() or not 1 <= int(token) <= len(choices):
+                print_warning(f"⚠️  Invalid selection: {token}")
+                break
+            picked.add(int(token) - 1)
+        else:
+            return [choice for index, choice in enumerate(choices) if index in picked]
 
 
 def configure_rule_packs(install_dir: Path) -> bool:
@@ -423,7 +447,7 @@ def configure_rule_packs(install_dir: Path) -> bool:
 
 
 def configure_agents(install_dir: Path) -> bool:
-    """Interactive agent configuration with checkbox menu."""
+    """Interactive agent configuration with a numbered selection menu."""
     print()
     print("─" * 72)
     print()
@@ -434,26 +458,7 @@ def configure_agents(install_dir: Path) -> bool:
         print_info("You can configure later by re-running install.py")
         return True
     
-    inquirer = ensure_inquirer()
-    if not inquirer:
-        return True  # Skip if inquirer couldn't be installed
-    
-    questions = [
-        inquirer.Checkbox(
-            'agents',
-            message='Select agents to configure (Space=select, Enter=confirm)',
-            choices=[
-                'Cursor (custom commands + User Rule)',
-                'Claude Code (instructions)',
-                'Gemini CLI (config symlink)',
-                'GitHub Copilot (instructions)',
-                'OpenAI Codex (instructions)',
-            ],
-        ),
-    ]
-    
-    answers = inquirer.prompt(questions)
-    selected = answers['agents'] if answers else []
+    selected = simple_checkbox('Select agents to configure:', list(AGENT_CONFIGURATORS))
     
     if not selected:
         print_warning("⊘ No agents selected")
@@ -464,34 +469,45 @@ def configure_agents(install_dir: Path) -> bool:
     print()
     
     for agent in selected:
-        if 'Cursor' in agent:
-            configure_cursor(install_dir)
-        elif 'Claude Code' in agent:
-            configure_claude_code()
-        elif 'Gemini CLI' in agent:
-            configure_gemini_cli(install_dir)
-        elif 'GitHub Copilot' in agent:
-            configure_github_copilot()
-        elif 'OpenAI Codex' in agent:
-            configure_openai_codex()
+        AGENT_CONFIGURATORS[agent](install_dir)
     
     print()
     print_success("✓ Agent configuration complete")
     return True
 
 
+def file_contains(path: Path, needle: str) -> bool:
+    """Check whether any line of a text file contains a substring.
+    
+    Reads line by line and stops at the first match instead of loading the
+    whole file.
+    
+    Args:
+        path: File to search
+        needle: Substring to look for (must not span lines)
+        
+    Returns:
+        True if found
+        
+    Raises:
+        OSError: If the file cannot be opened (e.g. FileNotFoundError)
+    """
+    with path.open('r', buffering=65536) as f:
+        return any(needle in line for line in f)
+
+
 def configure_cursor(install_dir: Path) -> bool:
     """Configure Cursor: symlink commands + run User Rule helper."""
     print_info("  [Cursor]")
 
     # Ensure ~/.cursor/commands points to build outputs
-    cursor_commands_dir = Path.home() / '.cursor' / 'commands'
+    cursor_commands_dir = CURSOR_COMMANDS_DIR
     cursor_commands_dir.parent.mkdir(parents=True, exist_ok=True)
 
     build_cursor_commands = install_dir / 'build' / 'cursor' / 'commands'
     if build_cursor_commands.exists():
         # Remove existing link/directory
-        if cursor_commands_dir.exists() or cursor_commands_dir.is_symlink():
+        if present(cursor_commands_dir):
             if cursor_commands_dir.is_dir() and not cursor_commands_dir.is_symlink():
                 shutil.rmtree(cursor_commands_dir)
             else:
@@ -519,27 +535,18 @@ def configure_cursor(install_dir: Path) -> bool:
     return True
 
 
-def configure_claude_code() -> bool:
-    """Display Claude Code configuration instructions."""
-    print_info("  [Claude Code]")
-    print_info("    1. Create .claude/config.yml in your project root")
-    print_info("    2. Add: rules: ['~/.agentsmd/AGENTS.md']")
-    print_success("    ✓ Instructions displayed")
-    return True
-
-
 def configure_gemini_cli(install_dir: Path) -> bool:
     """Configure Gemini CLI and Antigravity."""
     print_info("  [Gemini CLI / Antigravity]")
     
     # 1. Configure Gemini CLI prompts (legacy/standard CLI)
-    gemini_prompts_dir = Path.home() / '.config' / 'gemini' / 'prompts'
+    gemini_prompts_dir = GEMINI_PROMPTS_DIR
     gemini_prompts_dir.mkdir(parents=True, exist_ok=True)
     
     agents_md = install_dir / 'AGENTS.md'
     link_path = gemini_prompts_dir / 'agents.md'
     
-    if link_path.exists() or link_path.is_symlink():
+    if present(link_path):
         link_path.unlink()
     
     success, method, warning = create_link(link_path, agents_md)
@@ -549,14 +556,14 @@ def configure_gemini_cli(install_dir: Path) -> bool:
         print_warning(f"    ⚠️  Could not create symlink: {method}")
 
     # 2. Configure Antigravity (~/.gemini)
-    gemini_home = Path.home() / '.gemini'
+    gemini_home = GEMINI_HOME
     gemini_home.mkdir(exist_ok=True)
 
     # 2a. Symlink scripts to ~/.gemini/scripts (for sandbox visibility)
     gemini_scripts = gemini_home / 'scripts'
     agents_scripts = install_dir / 'scripts'
     
-    if gemini_scripts.exists() or gemini_scripts.is_symlink():
+    if present(gemini_scripts):
         if gemini_scripts.is_dir() and not gemini_scripts.is_symlink():
             shutil.rmtree(gemini_scripts)
         else:
@@ -571,13 +578,15 @@ def configure_gemini_cli(install_dir: Path) -> bool:
     # Update settings.json to include AGENTS.md in context
     settings_path = gemini_home / 'settings.json'
     settings = {}
-    if settings_path.exists():
-        try:
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
-        except Exception as e:
-            print_warning(f"    ⚠️  Failed to read {settings_path}: {e}")
-            # Continue with empty settings if read fails
+    settings_exists = True
+    try:
+        with open(settings_path, 'r') as f:
+            settings = json.load(f)
+    except FileNotFoundError:
+        settings_exists = False
+    except Exception as e:
+        print_warning(f"    ⚠️  Failed to read {settings_path}: {e}")
+        # Continue with empty settings if read fails
     
     # Ensure 'context' structure exists
     if 'context' not in settings:
@@ -588,20 +597,21 @@ def configure_gemini_cli(install_dir: Path) -> bool:
     if isinstance(context_files, str):
         context_files = [context_files]
     
-    # Update context files if needed
-    changed = False
-    if "AGENTS.md" not in context_files:
-        context_files.insert(0, "AGENTS.md") # Prepend AGENTS.md
-        if "GEMINI.md" not in context_files:
-            context_files.append("GEMINI.md")
-        
-        settings['context']['fileName'] = context_files
-        changed = True
+    # Update context files if needed (deduplicated, original order kept)
+    updated_files = list(dict.fromkeys(context_files))
+    known_files = set(updated_files)
+    if "AGENTS.md" not in known_files:
+        updated_files.insert(0, "AGENTS.md") # Prepend AGENTS.md
+        if "GEMINI.md" not in known_files:
+            updated_files.append("GEMINI.md")
+    
+    changed = updated_files != context_files
+    if changed:
+        settings['context']['fileName'] = updated_files
     
-    if changed or not settings_path.exists():
+    if changed or not settings_exists:
         try:
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f, indent=2)
+            write_text_atomic(settings_path, json.dumps(settings, indent=2))
             print_success(f"    ✓ Updated {settings_path} context.fileName")
         except Exception as e:
             print_error(f"    Failed to write {settings_path}: {e}")
@@ -610,7 +620,15 @@ def configure_gemini_cli(install_dir: Path) -> bool:
     gemini_md_path = gemini_home / 'GEMINI.md'
     import_line = "@~/.agentsmd/AGENTS.md"
     
-    if not gemini_md_path.exists():
+    try:
+        has_import = file_contains(gemini_md_path, import_line)
+    except FileNotFoundError:
+        has_import = None
+    except Exception as e:
+        print_error(f"    Failed to read {gemini_md_path}: {e}")
+        return True
+    
+    if has_import is None:
         try:
             with open(gemini_md_path, 'w') as f:
                 f.write(f"{import_line}\n")
@@ -619,12 +637,14 @@ def configure_gemini_cli(install_dir: Path) -> bool:
             print_error(f"    Failed to create {gemini_md_path}: {e}")
     else:
         try:
-            content = gemini_md_path.read_text()
-            if import_line not in content:
-                with open(gemini_md_path, 'a') as f:
-                    if content and not content.endswith('\n'):
-                        f.write('\n')
-                    f.write(f"{import_line}\n")
+            if not has_import:
+                # Append mode still allows reading the last byte to check for a newline
+                with open(gemini_md_path, 'ab+') as f:
+                    if f.seek(0, os.SEEK_END):
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            f.write(b'\n')
+                    f.write(f"{import_line}\n".encode())
                 print_success(f"    ✓ Appended import to {gemini_md_path}")
             else:
                 print_success(f"    ✓ Import already present in {gemini_md_path}")
@@ -634,22 +654,40 @@ def configure_gemini_cli(install_dir: Path) -> bool:
     return True
 
 
-def configure_github_copilot() -> bool:
-    """Display GitHub Copilot configuration instructions."""
-    print_info("  [GitHub Copilot]")
-    print_info("    1. Create .github/copilot-instructions.md in your project")
-    print_info("    2. Reference: 'See AGENTS.md for workflow standards'")
+# Setup steps for agents that are configured by hand
+AGENT_INSTRUCTIONS = {
+    'Claude Code': (
+        "1. Create .claude/config.yml in your project root",
+        "2. Add: rules: ['~/.agentsmd/AGENTS.md']",
+    ),
+    'GitHub Copilot': (
+        "1. Create .github/copilot-instructions.md in your project",
+        "2. Reference: 'See AGENTS.md for workflow standards'",
+    ),
+    'OpenAI Codex': (
+        "Add to ~/.openai-codex-prompt:",
+        "'Always read and follow ~/.agentsmd/AGENTS.md'",
+    ),
+}
+
+
+def print_agent_instructions(name: str) -> bool:
+    """Display configuration instructions for an instruction-only agent."""
+    print_info(f"  [{name}]")
+    for line in AGENT_INSTRUCTIONS[name]:
+        print_info(f"    {line}")
     print_success("    ✓ Instructions displayed")
     return True
 
 
-def configure_openai_codex() -> bool:
-    """Display OpenAI Codex configuration instructions."""
-    print_info("  [OpenAI Codex]")
-    print_info("    Add to ~/.openai-codex-prompt:")
-    print_info("    'Always read and follow ~/.agentsmd/AGENTS.md'")
-    print_success("    ✓ Instructions displayed")
-    return True
+# Menu label -> configurator taking the install directory, in menu order
+AGENT_CONFIGURATORS = {
+    'Cursor (custom commands + User Rule)': configure_cursor,
+    'Claude Code (instructions)': lambda _: print_agent_instructions('Claude Code'),
+    'Gemini CLI (config symlink)': configure_gemini_cli,
+    'GitHub Copilot (instructions)': lambda _: print_agent_instructions('GitHub Copilot'),
+    'OpenAI Codex (instructions)': lambda _: print_agent_instructions('OpenAI Codex'),
+}
 
 
 def print_summary(install_dir: Path, shell_config: str = ""):
@@ -723,7 +761,7 @@ def main():
     shell_config = ""
     if not is_windows():
         for config in ['.zshrc', '.bashrc', '.bash_profile']:
-            if (Path.home() / config).exists():
+            if (HOME / config).exists():
                 shell_config = config
                 break
     
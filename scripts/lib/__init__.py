@@ -4,6 +4,7 @@ This package provides common utilities for all workflow scripts:
 - common: Colors, git/gh helpers, output formatting
 - symlinks: Cross-platform symlink handling
 - github: GitHub CLI wrapper functions
+- gh_session: Reusable GitHub GraphQL session
 """
 
 __version__ = "1.0.0"
@@ -11,52 +11,80 @@ Provides:
 
 import json
 import os
+import re
+import stat
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 
+# orjson is an optional speedup for parsing large gh JSON payloads
+try:
+    import orjson
+    parse_json = orjson.loads
+except ImportError:
+    parse_json = json.loads
+
+
+# Marker file memoizing a successful `gh auth status` check
+GH_AUTH_CACHE = Path.home() / '.cache' / 'agentsmd' / 'gh_auth.ok'
+GH_AUTH_CACHE_TTL = 300
+
+# Precompiled patterns for branch name sanitization
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_DASH_RUN_RE = re.compile(r'-+')
+
+
+# Color only interactive terminals; honor NO_COLOR (https://no-color.org)
+IS_TTY = (
+    sys.stdout.isatty()
+    and os.environ.get('TERM', 'dumb') != 'dumb'
+    and not os.environ.get('NO_COLOR')
+)
+
 
 class Colors:
-    """ANSI color codes with terminal detection."""
-    
-    def __init__(self):
-        # Only use colors if stdout is a TTY and TERM is not 'dumb'
-        self.enabled = (
-            sys.stdout.isatty() 
-            and os.environ.get('TERM', 'dumb') != 'dumb'
-        )
-    
-    @property
-    def RED(self) -> str:
-        return '\033[0;31m' if self.enabled else ''
-    
-    @property
-    def GREEN(self) -> str:
-        return '\033[0;32m' if self.enabled else ''
-    
-    @property
-    def YELLOW(self) -> str:
-        return '\033[1;33m' if self.enabled else ''
-    
-    @property
-    def BLUE(self) -> str:
-        return '\033[0;34m' if self.enabled else ''
+    """ANSI color codes, blank when output is not an interactive terminal.
     
-    @property
-    def PURPLE(self) -> str:
-        return '\033[0;35m' if self.enabled else ''
+    Codes are resolved once at construction, so piped output carries no
+    escape sequences and formatting them costs nothing extra.
+    """
     
-    @property
-    def NC(self) -> str:
-        """No Color - reset."""
-        return '\033[0m' if self.enabled else ''
+    def __init__(self, enabled: bool = IS_TTY):
+        self.enabled = enabled
+        self.RED = '\033[0;31m' if enabled else ''
+        self.GREEN = '\033[0;32m' if enabled else ''
+        self.YELLOW = '\033[1;33m' if enabled else ''
+        self.BLUE = '\033[0;34m' if enabled else ''
+        self.PURPLE = '\033[0;35m' if enabled else ''
+        self.NC = '\033[0m' if enabled else ''  # No Color - reset
 
 
 # Global colors instance
 colors = Colors()
 
 
+def blue(text: str) -> str:
+    """Wrap text in blue (unchanged when colors are disabled)."""
+    return f"{colors.BLUE}{text}{colors.NC}"
+
+
+def green(text: str) -> str:
+    """Wrap text in green (unchanged when colors are disabled)."""
+    return f"{colors.GREEN}{text}{colors.NC}"
+
+
+def yellow(text: str) -> str:
+    """Wrap text in yellow (unchanged when colors are disabled)."""
+    return f"{colors.YELLOW}{text}{colors.NC}"
+
+
+def print_field(label: str, value) -> None:
+    """Print a 'Label: value' status line with the label in blue."""
+    print(f"{blue(label + ':')} {value}")
+
+
 def print_error(message: str) -> None:
     """Print error message in red."""
     print(f"{colors.RED}{message}{colors.NC}", file=sys.stderr)
@@ -145,9 +173,9 @@ def run_gh(
     
     if json_output and result.returncode == 0 and result.stdout:
         try:
-            parsed = json.loads(result.stdout)
+            parsed = parse_json(result.stdout)
             return result, parsed
-        except json.JSONDecodeError:
+        except ValueError:
             print_error(f"Failed to parse JSON output from gh: {result.stdout}")
             return result, None
     
@@ -188,6 +216,87 @@ def get_current_branch() -> Optional[str]:
     return None
 
 
+def get_status_v2() -> Optional[Dict[str, Any]]:
+    """Get branch and tracking state from one `git status --porcelain=v2 --branch`.
+    
+    Untracked files are not scanned, so `dirty` reflects tracked changes only.
+    
+    Returns:
+        Dict with keys:
+        - branch: current branch name, or None if detached
+        - upstream: upstream ref (e.g. 'origin/feat/1-x'), or None
+        - ahead/behind: commits relative to upstream, or None if the
+          upstream is unset or gone
+        - dirty: True if tracked files have staged or unstaged changes
+        Returns None if not in a git repository.
+    """
+    result = run_git('status', '--porcelain=v2', '--branch', '--untracked-files=no')
+    if result.returncode != 0:
+        return None
+    
+    status = {'branch': None, 'upstream': None, 'ahead': None, 'behind': None, 'dirty': False}
+    for line in result.stdout.splitlines():
+        if not line.startswith('# '):
+            if line:
+                status['dirty'] = True
+            continue
+        key, _, value = line[2:].partition(' ')
+        if key == 'branch.head' and value != '(detached)':
+            status['branch'] = value
+        elif key == 'branch.upstream':
+            status['upstream'] = value
+        elif key == 'branch.ab':
+            ahead, _, behind = value.partition(' ')
+            status['ahead'] = int(ahead)
+            status['behind'] = -int(behind)
+    return status
+
+
+def _gh_hosts_file() -> Path:
+    """Locate the gh CLI hosts.yml that stores authentication state."""
+    if os.environ.get('GH_CONFIG_DIR'):
+        return Path(os.environ['GH_CONFIG_DIR']) / 'hosts.yml'
+    if os.name == 'nt' and os.environ.get('APPDATA'):
+        return Path(os.environ['APPDATA']) / 'GitHub CLI' / 'hosts.yml'
+    config_home = os.environ.get('XDG_CONFIG_HOME') or str(Path.home() / '.config')
+    return Path(config_home) / 'gh' / 'hosts.yml'
+
+
+def check_gh_auth_status(ttl: int = GH_AUTH_CACHE_TTL) -> bool:
+    """Check `gh auth status`, memoizing success on disk for a short TTL.
+    
+    The cache marker is only trusted if it is younger than `ttl` seconds
+    and newer than gh's hosts.yml, so logging in/out invalidates it.
+    
+    Args:
+        ttl: Maximum age of a cached success in seconds
+        
+    Returns:
+        True if GitHub CLI is authenticated
+    """
+    try:
+        marker_mtime = GH_AUTH_CACHE.stat().st_mtime
+        try:
+            hosts_mtime = _gh_hosts_file().stat().st_mtime
+        except OSError:
+            hosts_mtime = 0
+        if marker_mtime > hosts_mtime and time.time() - marker_mtime < ttl:
+            return True
+    except OSError:
+        pass
+    
+    result = run_command(['gh', 'auth', 'status'])
+    if result.returncode != 0:
+        return False
+    
+    try:
+        GH_AUTH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        GH_AUTH_CACHE.touch()
+    except OSError:
+        pass  # Cache is best-effort
+    return True
+
+
 def check_gh_auth() -> Tuple[bool, Optional[str]]:
     """Check if GitHub CLI is authenticated.
     
@@ -229,15 +338,14 @@ def sanitize_branch_name(text: str, max_length: int = 50) -> str:
     Returns:
         Sanitized branch name component
     """
-    import re
     # Convert to lowercase
     result = text.lower()
     # Replace non-alphanumeric with dash
-    result = re.sub(r'[^a-z0-9]+', '-', result)
+    result = _NON_ALNUM_RE.sub('-', result)
     # Remove leading/trailing dashes
     result = result.strip('-')
     # Collapse multiple dashes
-    result = re.sub(r'-+', '-', result)
+    result = _DASH_RUN_RE.sub('-', result)
     # Limit length
     return result[:max_length]
 
@@ -305,3 +413,40 @@ def check_command_exists(command: str) -> bool:
     result = run_command(['which', command] if os.name != 'nt' else ['where', command])
     return result.returncode == 0
 
+
+
+def write_text_atomic(path: Path, *chunks: str) -> None:
+    """Write text chunks to path via a sibling temp file and atomic rename.
+    
+    Readers never observe a partially written file, even if the write fails.
+    Symlinks are written through and the existing file mode is kept, and
+    hard-linked files (the Windows link fallback) are rewritten in place so
+    every link keeps seeing updates.
+    
+    Args:
+        path: Destination file
+        *chunks: Text written in order
+    """
+    path = path.resolve()
+    try:
+        existing = path.stat()
+    except OSError:
+        existing = None
+    if existing is not None and existing.st_nlink > 1:
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return
+    
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        if existing is not None:
+            os.chmod(tmp_path, stat.S_IMODE(existing.st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.access(tmp_path, os.F_OK):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Persistent GitHub GraphQL session for AgentsToolkit.
+
+Every `gh` invocation pays for a process spawn plus an auth token load.
+Workflow scripts that issue several read-only queries in a row can instead
+reuse a single authenticated HTTPS connection:
+- Token is fetched once via `gh auth token`
+- Repository owner/name are resolved once, the way gh picks them
+- Queries share one keep-alive connection to the GraphQL API (stdlib only)
+
+Callers should check `available` and fall back to `run_gh` when the session
+cannot be used (no token, non-github.com repo, ambiguous remotes, etc.).
+"""
+
+import http.client
+import json
+import os
+import re
+import threading
+from typing import Optional, Dict, Any, Tuple
+
+from .common import run_command, run_git, print_error, parse_json
+
+
+GRAPHQL_HOST = 'api.github.com'
+GRAPHQL_PATH = '/graphql'
+
+# Matches github.com remotes: https://github.com/owner/repo(.git) or git@github.com:owner/repo.git
+_GITHUB_REMOTE_RE = re.compile(
+    r'github\.com[:/](?P<owner>[^/\s]+)/(?P<name>[^/\s]+?)(?:\.git)?/?$'
+)
+
+# `git config --get-regexp` lines for remote URLs and `gh repo set-default` markers
+_REMOTE_CONFIG_RE = re.compile(
+    r'^remote\.(?P<remote>.+)\.(?P<key>url|gh-resolved) (?P<value>.*)$', re.MULTILINE
+)
+
+
+def _parse_repo_spec(spec: str) -> Optional[Tuple[str, str]]:
+    """Parse a GH_REPO-style `[HOST/]OWNER/REPO` spec for github.com.
+
+    Args:
+        spec: Repository spec
+
+    Returns:
+        (owner, name), or None if malformed or on another host
+    """
+    parts = spec.strip().split('/')
+    if len(parts) == 3 and parts[0] == 'github.com':
+        parts = parts[1:]
+    if len(parts) != 2 or not all(parts):
+        return None
+    return parts[0], parts[1]
+
+
+def _repo_from_remote_config(config: str) -> Optional[Tuple[str, str]]:
+    """Pick the repository gh would use from the remote configuration.
+
+    A remote marked by `gh repo set-default` wins. Without one, gh prompts
+    or errors when several GitHub remotes exist (e.g. a fork with
+    `upstream`), so a repo is only returned when exactly one remote points
+    at github.com.
+
+    Args:
+        config: Output of `git config --get-regexp '^remote\\..*\\.(url|gh-resolved)$'`
+
+    Returns:
+        (owner, name), or None if the choice is ambiguous or not on github.com
+    """
+    remotes: Dict[str, Tuple[str, str]] = {}
+    resolved: Dict[str, str] = {}
+    for match in _REMOTE_CONFIG_RE.finditer(config):
+        remote, value = match.group('remote'), match.group('value').strip()
+        if match.group('key') == 'gh-resolved':
+            resolved[remote] = value
+            continue
+        url_match = _GITHUB_REMOTE_RE.search(value)
+        if url_match:
+            remotes.setdefault(remote, (url_match.group('owner'), url_match.group('name')))
+
+    for remote, value in resolved.items():
+        # Current gh stores 'base' on the chosen remote; older releases stored OWNER/REPO
+        if value == 'base':
+            return remotes.get(remote)
+        return _parse_repo_spec(value)
+
+    repos = set(remotes.values())
+    return repos.pop() if len(repos) == 1 else None
+
+
+class GHSession:
+    """Authenticated GraphQL client reused across GitHub queries."""
+
+    def __init__(self):
+        self._token: Optional[str] = None
+        self._repo: Optional[Tuple[str, str]] = None
+        self._resolved = False
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        # One connection carries one request at a time; scripts may query from threads
+        self._lock = threading.Lock()
+
+    def _resolve(self) -> None:
+        """Load token and repository coordinates on first use."""
+        if self._resolved:
+            return
+        self._resolved = True
+
+        # Honor gh's own overrides; a non-github.com host is left to gh
+        if os.environ.get('GH_HOST', 'github.com') != 'github.com':
+            return
+        if os.environ.get('GH_REPO'):
+            repo = _parse_repo_spec(os.environ['GH_REPO'])
+        else:
+            result = run_git('config', '--get-regexp', r'^remote\..*\.(url|gh-resolved)$')
+            repo = _repo_from_remote_config(result.stdout) if result.returncode == 0 else None
+        if not repo:
+            return
+
+        result = run_command(['gh', 'auth', 'token'])
+        if result.returncode != 0 or not result.stdout:
+            return
+
+        self._repo = repo
+        self._token = result.stdout.strip()
+
+    @property
+    def available(self) -> bool:
+        """Whether queries can be served without spawning gh."""
+        self._resolve()
+        return self._token is not None
+
+    @property
+    def repo(self) -> Optional[Tuple[str, str]]:
+        """Repository (owner, name) that gh would target."""
+        self._resolve()
+        return self._repo
+
+    def _post(self, payload: bytes) -> Tuple[int, bytes]:
+        """POST a GraphQL payload over the kept-alive connection.
+
+        A connection the server has since closed is reopened once; queries
+        are read-only, so resending is safe.
+        """
+        headers = {
+            'Authorization': f'bearer {self._token}',
+            'Content-Type': 'application/json',
+            'User-Agent': 'AgentsToolkit',
+        }
+        with self._lock:
+            for attempt in range(2):
+                if self._conn is None:
+                    self._conn = http.client.HTTPSConnection(GRAPHQL_HOST, timeout=30)
+                try:
+                    self._conn.request('POST', GRAPHQL_PATH, body=payload, headers=headers)
+                    response = self._conn.getresponse()
+                    return response.status, response.read()
+                except (http.client.HTTPException, OSError):
+                    self._conn.close()
+                    self._conn = None
+                    if attempt:
+                        raise
+
+    def graphql(self, query: str, **variables: Any) -> Optional[Dict[str, Any]]:
+        """Run a GraphQL query against the GitHub API.
+
+        Args:
+            query: GraphQL query document
+            **variables: Query variables
+
+        Returns:
+            The response `data` dict, or None on error
+        """
+        if not self.available:
+            return None
+
+        payload = json.dumps({'query': query, 'variables': variables}).encode('utf-8')
+        try:
+            status, body = self._post(payload)
+            parsed = parse_json(body)
+        except (http.client.HTTPException, OSError, ValueError) as e:
+            print_error(f"GitHub API Error: {e}")
+            return None
+
+        if status != 200:
+            message = parsed.get('message', '') if isinstance(parsed, dict) else ''
+            print_error(f"GitHub API Error: HTTP {status} {message}".rstrip())
+            return None
+
+        if parsed.get('errors'):
+            messages = '; '.join(err.get('message', '') for err in parsed['errors'])
+            print_error(f"GitHub API Error: {messages}")
+
+        return parsed.get('data')
+
+
+# Shared session instance, created lazily
+_session: Optional[GHSession] = None
+
+
+def get_session() -> GHSession:
+    """Get the shared GHSession for this process.
+
+    Returns:
+        GHSession instance
+    """
+    global _session
+    if _session is None:
+        _session = GHSession()
+    return _session
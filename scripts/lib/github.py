@@ -6,13 +6,108 @@ Provides high-level functions for common GitHub operations:
 - Pull request management
 - Repository information
 - Branch/commit operations
+
+Read-only queries go through a shared GHSession (GraphQL over HTTP) when
+available, falling back to spawning the gh CLI otherwise.
 """
 
 import json
+import re
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
-from .common import run_gh, run_git, get_repo_root
+from .common import run_command, run_gh, run_git, get_repo_root, parse_json
+from .gh_session import get_session
+
+
+# On-disk memo of PR lookups; developers re-run push/status many times a minute
+PR_CACHE_DIR = Path.home() / '.cache' / 'agentsmd'
+PR_CACHE_TTL = 60
+
+# Matches issue numbers in branch names: fix/123-, feat-45-, 67-description
+_BRANCH_ISSUE_RE = re.compile(r'(?:^|[-_/])(\d+)(?:[-_/]|$)')
+
+# GraphQL equivalents of the gh --json field sets used below
+_ISSUE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) { number title body state url }
+  }
+}
+"""
+
+_PR_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      number title body state url headRefName baseRefName
+    }
+  }
+}
+"""
+
+_PR_LIST_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!],
+      $head: String, $base: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 30, states: $states, headRefName: $head, baseRefName: $base,
+                 orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { number title headRefName baseRefName url }
+    }
+  }
+}
+"""
+
+_DEFAULT_BRANCH_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { name }
+  }
+}
+"""
+
+# PR body skeleton per AGENTS.md template; sections are pre-rendered bullet lists
+_PR_BODY_TEMPLATE = (
+    "## Summary\n\n{summary}\n\n"
+    "## Changes\n\n{changes}\n\n"
+    "## How to Test\n\n{how_to_test}\n\n"
+    "## Known Limitations\n\n{limitations}\n\n"
+    "{closes}"
+)
+_DEFAULT_CHANGES = "- Implementation changes"
+_DEFAULT_HOW_TO_TEST = (
+    "- [ ] Manual testing completed\n"
+    "- [ ] All tests pass\n"
+    "- [ ] Code review approved"
+)
+_DEFAULT_LIMITATIONS = "- None identified"
+
+# gh pr list --state values mapped to GraphQL PullRequestState filters
+_PR_STATES = {
+    'open': ['OPEN'],
+    'closed': ['CLOSED', 'MERGED'],
+    'merged': ['MERGED'],
+    'all': None,
+}
+
+
+def _query_repository(query: str, **variables: Any) -> Optional[Dict[str, Any]]:
+    """Run a repository-scoped GraphQL query through the shared session.
+    
+    Args:
+        query: GraphQL query taking $owner and $name
+        **variables: Additional query variables
+        
+    Returns:
+        The `repository` object, or None on error
+    """
+    session = get_session()
+    owner, name = session.repo
+    data = session.graphql(query, owner=owner, name=name, **variables)
+    if data:
+        return data.get('repository')
+    return None
 
 
 def get_issue(issue_num: int) -> Optional[Dict[str, Any]]:
@@ -24,6 +119,10 @@ def get_issue(issue_num: int) -> Optional[Dict[str, Any]]:
     Returns:
         Issue dict with keys like title, body, state, url, or None if not found
     """
+    if get_session().available:
+        repository = _query_repository(_ISSUE_QUERY, number=issue_num)
+        return repository.get('issue') if repository else None
+    
     result, parsed = run_gh(
         'issue', 'view', str(issue_num),
         '--json', 'number,title,body,state,url',
@@ -124,21 +223,88 @@ def add_issue_comment(issue_num: int, comment: str) -> bool:
     return result.returncode == 0
 
 
-def get_pr(pr_num: int) -> Optional[Dict[str, Any]]:
+def _pr_cache_file(kind: str, *key: Any) -> Path:
+    """Path of the cache entry for a PR lookup.
+    
+    Args:
+        kind: Lookup kind, used as a filename prefix
+        *key: Values identifying the lookup
+        
+    Returns:
+        Cache file path
+    """
+    import hashlib
+    
+    digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=10).hexdigest()
+    return PR_CACHE_DIR / f'pr-{kind}-{digest}.json'
+
+
+def _pr_cache_load(path: Path, ttl: int = PR_CACHE_TTL) -> Tuple[bool, Any]:
+    """Load a cached PR lookup if it is younger than `ttl` seconds.
+    
+    Returns:
+        Tuple of (hit, value)
+    """
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return False, None
+        with open(path, 'r', encoding='utf-8') as f:
+            return True, json.load(f)['value']
+    except (OSError, ValueError, KeyError, TypeError):
+        return False, None
+
+
+def _pr_cache_store(path: Path, value: Any) -> None:
+    """Store a PR lookup result (best-effort)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'value': value}, f)
+    except OSError:
+        pass
+
+
+def _pr_cache_clear(kind: str) -> None:
+    """Drop all cached PR lookups of one kind (best-effort)."""
+    try:
+        for path in PR_CACHE_DIR.glob(f'pr-{kind}-*.json'):
+            path.unlink()
+    except OSError:
+        pass
+
+
+def get_pr(pr_num: int, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """Get pull request details.
     
     Args:
         pr_num: PR number
+        use_cache: Reuse a result fetched in the last PR_CACHE_TTL seconds
         
     Returns:
         PR dict or None if not found
     """
-    result, parsed = run_gh(
-        'pr', 'view', str(pr_num),
-        '--json', 'number,title,body,state,url,headRefName,baseRefName',
-        json_output=True
-    )
-    return parsed
+    cache_file = None
+    if use_cache:
+        repo_root = get_repo_root()
+        if repo_root:
+            cache_file = _pr_cache_file('view', str(repo_root), pr_num)
+            hit, cached = _pr_cache_load(cache_file)
+            if hit:
+                return cached
+    
+    if get_session().available:
+        repository = _query_repository(_PR_QUERY, number=pr_num)
+        pr = repository.get('pullRequest') if repository else None
+    else:
+        result, pr = run_gh(
+            'pr', 'view', str(pr_num),
+            '--json', 'number,title,body,state,url,headRefName,baseRefName',
+            json_output=True
+        )
+    
+    if cache_file and pr:
+        _pr_cache_store(cache_file, pr)
+    return pr
 
 
 def create_pr(
@@ -181,6 +347,8 @@ def create_pr(
         result, _ = run_gh(*cmd, json_output=False)
         
         if result.returncode == 0 and result.stdout:
+            # Cached "no PR for this branch" answers are now stale
+            _pr_cache_clear('exists')
             url = result.stdout.strip()
             try:
                 # Extract number from URL: https://github.com/owner/repo/pull/123
@@ -222,7 +390,11 @@ def update_pr(
         cmd.extend(['--base', base])
     
     result, _ = run_gh(*cmd)
-    return result.returncode == 0
+    if result.returncode == 0:
+        # Cached PR details now predate this edit
+        _pr_cache_clear('view')
+        return True
+    return False
 
 
 def list_prs(
@@ -240,6 +412,17 @@ def list_prs(
     Returns:
         List of PR dicts
     """
+    if get_session().available:
+        repository = _query_repository(
+            _PR_LIST_QUERY,
+            states=_PR_STATES.get(state, ['OPEN']),
+            head=head,
+            base=base
+        )
+        if repository:
+            return repository.get('pullRequests', {}).get('nodes') or []
+        return []
+    
     cmd = ['pr', 'list', '--state', state, '--json', 'number,title,headRefName,baseRefName,url']
     
     if head:
@@ -251,20 +434,42 @@ def list_prs(
     return parsed if parsed else []
 
 
-def check_pr_exists(branch: str, base: str = 'main') -> Optional[int]:
+def check_pr_exists(
+    branch: str,
+    base: Optional[str] = 'main',
+    use_cache: bool = True
+) -> Optional[int]:
     """Check if a PR exists for the given branch.
     
+    Cached results are keyed by repository, branch, base, and the branch's
+    head commit, so new commits always trigger a fresh lookup.
+    
     Args:
         branch: Head branch name
-        base: Base branch name
+        base: Base branch name, or None to match a PR against any base
+        use_cache: Reuse a result fetched in the last PR_CACHE_TTL seconds
         
     Returns:
         PR number if exists, None otherwise
     """
+    cache_file = None
+    if use_cache:
+        # Repository root and head commit in one git call
+        result = run_git('rev-parse', '--show-toplevel', branch)
+        lines = result.stdout.split('\n') if result.returncode == 0 else []
+        lines = [line for line in lines if line]
+        if len(lines) == 2:
+            cache_file = _pr_cache_file('exists', lines[0], branch, base, lines[1])
+            hit, cached = _pr_cache_load(cache_file)
+            if hit:
+                return cached
+    
     prs = list_prs(state='all', head=branch, base=base)
-    if prs and len(prs) > 0:
-        return prs[0].get('number')
-    return None
+    pr_num = prs[0].get('number') if prs else None
+    
+    if cache_file:
+        _pr_cache_store(cache_file, pr_num)
+    return pr_num
 
 
 def get_repo_default_branch() -> str:
@@ -273,12 +478,105 @@ def get_repo_default_branch() -> str:
     Returns:
         Default branch name (e.g., 'main' or 'master')
     """
+    if get_session().available:
+        repository = _query_repository(_DEFAULT_BRANCH_QUERY)
+        if repository and repository.get('defaultBranchRef'):
+            return repository['defaultBranchRef'].get('name', 'main')
+        return 'main'
+    
     result, parsed = run_gh('repo', 'view', '--json', 'defaultBranchRef', json_output=True)
     if parsed:
         return parsed.get('defaultBranchRef', {}).get('name', 'main')
     return 'main'
 
 
+def check_admin_access() -> bool:
+    """Check whether the authenticated user can administer the repository.
+    
+    Returns:
+        True if the viewer has ADMIN permission
+    """
+    result, parsed = run_gh('repo', 'view', '--json', 'viewerPermission', json_output=True)
+    return bool(parsed) and parsed.get('viewerPermission') == 'ADMIN'
+
+
+def get_branch_protection(branch: str) -> Optional[Dict[str, Any]]:
+    """Get the protection rules applied to a branch.
+    
+    Args:
+        branch: Branch name
+        
+    Returns:
+        Protection settings dict, or None if the branch is unprotected
+    """
+    # Unprotected branches answer 404; call gh directly so that is not reported as an error
+    result = run_command(['gh', 'api', f'repos/{{owner}}/{{repo}}/branches/{branch}/protection'])
+    if result.returncode != 0 or not result.stdout:
+        return None
+    try:
+        return parse_json(result.stdout)
+    except ValueError:
+        return None
+
+
+def is_branch_protected(branch: str) -> bool:
+    """Check if a branch has protection rules.
+    
+    Args:
+        branch: Branch name
+        
+    Returns:
+        True if the branch is protected
+    """
+    return get_branch_protection(branch) is not None
+
+
+def enable_branch_protection(
+    branch: str,
+    require_pr_reviews: bool = True,
+    required_status_checks: Optional[List[str]] = None,
+    enforce_admins: bool = False,
+    allow_force_pushes: bool = False,
+    allow_deletions: bool = False
+) -> Tuple[bool, Optional[str]]:
+    """Apply protection rules to a branch, replacing any existing ones.
+    
+    Args:
+        branch: Branch name
+        require_pr_reviews: Require changes to land through a pull request
+        required_status_checks: Check names that must pass before merging
+        enforce_admins: Apply the rules to administrators too
+        allow_force_pushes: Permit force pushes
+        allow_deletions: Permit deleting the branch
+        
+    Returns:
+        Tuple of (success, error message or None)
+    """
+    cmd = [
+        'gh', 'api', '--method', 'PUT',
+        f'repos/{{owner}}/{{repo}}/branches/{branch}/protection',
+        '-F', f'enforce_admins={str(enforce_admins).lower()}',
+        '-F', f'allow_force_pushes={str(allow_force_pushes).lower()}',
+        '-F', f'allow_deletions={str(allow_deletions).lower()}',
+        '-F', 'restrictions=null',
+    ]
+    if require_pr_reviews:
+        cmd += ['-F', 'required_pull_request_reviews[required_approving_review_count]=0']
+    else:
+        cmd += ['-F', 'required_pull_request_reviews=null']
+    if required_status_checks:
+        cmd += ['-F', 'required_status_checks[strict]=false']
+        for check in required_status_checks:
+            cmd += ['-f', f'required_status_checks[contexts][]={check}']
+    else:
+        cmd += ['-F', 'required_status_checks=null']
+    
+    result = run_command(cmd)
+    if result.returncode == 0:
+        return True, None
+    return False, (result.stderr or result.stdout).strip() or None
+
+
 def get_issue_from_branch(branch: str) -> Optional[int]:
     """Extract issue number from branch name or git config.
     
@@ -292,8 +590,6 @@ def get_issue_from_branch(branch: str) -> Optional[int]:
     Returns:
         Issue number if found, None otherwise
     """
-    import re
-    
     # Method 1: Git config
     result = run_git('config', f'branch.{branch}.issue')
     if result.returncode == 0 and result.stdout:
@@ -304,7 +600,7 @@ def get_issue_from_branch(branch: str) -> Optional[int]:
     
     # Method 2: Branch name patterns
     # Matches: fix/123-, feat-45-, 67-description, category/123-desc
-    match = re.search(r'(?:^|[-_/])(\d+)(?:[-_/]|$)', branch)
+    match = _BRANCH_ISSUE_RE.search(branch)
     if match:
         try:
             issue_num = int(match.group(1))
@@ -366,6 +662,11 @@ def is_branch_pushed(branch: str) -> bool:
     Returns:
         True if branch is pushed to origin
     """
+    # Local remote-tracking ref is enough; avoids a network round-trip
+    result = run_git('rev-parse', '--verify', '--quiet', f'refs/remotes/origin/{branch}')
+    if result.returncode == 0:
+        return True
+    
     result = run_git('ls-remote', '--exit-code', '--heads', 'origin', branch)
     return result.returncode == 0
 
@@ -389,38 +690,19 @@ def format_pr_body(
     Returns:
         Formatted PR body (markdown)
     """
-    body = "## Summary\n\n"
-    body += summary or "Implementation changes"
-    body += "\n\n"
-    
-    body += "## Changes\n\n"
-    if changes:
-        for change in changes:
-            body += f"- {change}\n"
-    else:
-        body += "- Implementation changes\n"
-    body += "\n"
-    
-    body += "## How to Test\n\n"
-    if how_to_test:
-        for step in how_to_test:
-            body += f"- [ ] {step}\n"
-    else:
-        body += "- [ ] Manual testing completed\n"
-        body += "- [ ] All tests pass\n"
-        body += "- [ ] Code review approved\n"
-    body += "\n"
-    
-    body += "## Known Limitations\n\n"
-    if limitations:
-        for limitation in limitations:
-            body += f"- {limitation}\n"
-    else:
-        body += "- None identified\n"
-    body += "\n"
-    
-    if issue_num:
-        body += f"Closes #{issue_num}\n"
+    changes_md = '\n'.join(f"- {change}" for change in changes) if changes else _DEFAULT_CHANGES
+    how_to_test_md = (
+        '\n'.join(f"- [ ] {step}" for step in how_to_test) if how_to_test else _DEFAULT_HOW_TO_TEST
+    )
+    limitations_md = (
+        '\n'.join(f"- {limitation}" for limitation in limitations) if limitations else _DEFAULT_LIMITATIONS
+    )
     
-    return body
+    return _PR_BODY_TEMPLATE.format(
+        summary=summary or "Implementation changes",
+        changes=changes_md,
+        how_to_test=how_to_test_md,
+        limitations=limitations_md,
+        closes=f"Closes #{issue_num}\n" if issue_num else ""
+    )
 
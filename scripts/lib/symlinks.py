@@ -13,6 +13,7 @@ On Unix-like systems (macOS, Linux), symlinks work without special permissions.
 import os
 import platform
 import shutil
+import stat
 import subprocess
 from pathlib import Path
 from typing import Tuple, Optional
@@ -23,31 +24,6 @@ def is_windows() -> bool:
     return platform.system() == 'Windows'
 
 
-def create_symlink(
-    link_path: Path,
-    target_path: Path,
-    target_is_dir: bool = False
-) -> Tuple[bool, str]:
-    """Create a symbolic link (Unix/Windows with permissions).
-    
-    Args:
-        link_path: Path where the symlink will be created
-        target_path: Path that the symlink points to
-        target_is_dir: Whether target is a directory
-        
-    Returns:
-        Tuple of (success, method_description)
-    """
-    try:
-        link_path.symlink_to(target_path, target_is_directory=target_is_dir)
-        return True, "symlink"
-    except OSError as e:
-        # Common on Windows without Developer Mode or admin
-        return False, f"symlink failed: {e}"
-    except Exception as e:
-        return False, f"symlink error: {e}"
-
-
 def create_junction(link_path: Path, target_path: Path) -> Tuple[bool, str]:
     """Create a junction (Windows directory symlink without special permissions).
     
@@ -142,6 +118,30 @@ def copy_as_fallback(
         return False, f"copy failed: {e}"
 
 
+def _check_existing_link(
+    link_path: Path,
+    target_path: Path
+) -> Tuple[bool, str, Optional[str]]:
+    """Report on a link_path that already exists.
+    
+    Args:
+        link_path: Existing path where the link was to be created
+        target_path: Resolved path the link should point to
+        
+    Returns:
+        Tuple of (success, method_used, warning_message or None)
+    """
+    # Check if existing path already points to target
+    # (works for symlinks; junctions resolve correctly too)
+    try:
+        if link_path.resolve() == target_path:
+            existing_type = "symlink" if link_path.is_symlink() else "junction/link"
+            return True, f"existing {existing_type}", None
+    except OSError:
+        pass  # Broken link, will fall through to error
+    return False, "none", f"Link path already exists: {link_path}"
+
+
 def create_link(
     link_path: Path,
     target_path: Path,
@@ -167,12 +167,13 @@ def create_link(
     link_path = link_path.resolve()
     target_path = target_path.resolve()
     
-    # Check if target exists
-    if not target_path.exists():
+    # Single stat tells us both whether the target exists and its type
+    try:
+        target_stat = os.stat(target_path)
+    except OSError:
         return False, "none", f"Target does not exist: {target_path}"
     
-    # Determine if target is a directory
-    target_is_dir = target_path.is_dir()
+    target_is_dir = stat.S_ISDIR(target_stat.st_mode)
     
     # Remove existing link if force=True
     if force and link_path.exists():
@@ -184,25 +185,28 @@ def create_link(
         except Exception as e:
             return False, "none", f"Could not remove existing link: {e}"
     
-    # Check if link already exists
-    if link_path.exists():
-        # Check if existing path already points to target
-        # (works for symlinks; junctions resolve correctly too)
-        try:
-            if link_path.resolve() == target_path:
-                existing_type = "symlink" if link_path.is_symlink() else "junction/link"
-                return True, f"existing {existing_type}", None
-        except OSError:
-            pass  # Broken link, will fall through to error
-        return False, "none", f"Link path already exists: {link_path}"
-    
     # Ensure parent directory exists
     link_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Try symlink first (works on all platforms if permissions allow)
-    success, method = create_symlink(link_path, target_path, target_is_dir)
-    if success:
-        return True, method, None
+    # Try symlink first (works on all platforms if permissions allow).
+    # An existing link_path surfaces as FileExistsError, so the common
+    # "not linked yet" path needs no separate existence check.
+    try:
+        os.symlink(
+            os.fspath(target_path),
+            os.fspath(link_path),
+            target_is_directory=target_is_dir
+        )
+        return True, "symlink", None
+    except FileExistsError:
+        return _check_existing_link(link_path, target_path)
+    except OSError:
+        pass
+    
+    # Permission failures (Windows) may be raised before the existence check,
+    # so confirm link_path is free before trying the fallbacks
+    if os.path.lexists(link_path):
+        return _check_existing_link(link_path, target_path)
     
     # On Windows, try junction for directories
     if is_windows() and target_is_dir:
@@ -243,6 +247,10 @@ def check_symlink_support() -> Tuple[bool, str]:
     Returns:
         Tuple of (supports_symlinks, explanation)
     """
+    # Symlinks always work on Unix-like systems; only Windows needs a probe
+    if not is_windows():
+        return True, "Symlinks supported"
+    
     import tempfile
     
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -256,17 +264,32 @@ def check_symlink_support() -> Tuple[bool, str]:
             link.symlink_to(target)
             return True, "Symlinks supported"
         except OSError:
-            if is_windows():
-                return False, (
-                    "Symlinks require Developer Mode or Administrator privileges. "
-                    "Will use junctions/hard links/copies as fallback."
-                )
-            else:
-                return False, "Symlinks not supported (unexpected on Unix)"
+            return False, (
+                "Symlinks require Developer Mode or Administrator privileges. "
+                "Will use junctions/hard links/copies as fallback."
+            )
         except Exception as e:
             return False, f"Symlink test failed: {e}"
 
 
+def present(path: Path) -> bool:
+    """Check whether anything exists at a path, including broken symlinks.
+    
+    Equivalent to `path.exists() or path.is_symlink()` with a single lstat.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if a file, directory, or link is present
+    """
+    try:
+        os.lstat(path)
+    except OSError:
+        return False
+    return True
+
+
 def remove_link(link_path: Path) -> bool:
     """Remove a link (symlink, junction, hard link, or copied file/dir).
     
@@ -277,7 +300,7 @@ def remove_link(link_path: Path) -> bool:
         True if removed successfully, False otherwise
     """
     try:
-        if not link_path.exists() and not link_path.is_symlink():
+        if not present(link_path):
             return True  # Already gone
         
         if link_path.is_dir() and not link_path.is_symlink():
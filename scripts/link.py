@@ -5,6 +5,7 @@ Usage: link.py <pr_number> <issue_number>
 """
 
 import argparse
+import re
 import sys
 from pathlib import Path
 
@@ -18,6 +19,10 @@ from lib.common import (
 from lib.github import get_pr, get_issue, update_pr
 
 
+# Lines carrying a closing keyword (Closes #N, Fixes #N, Resolves #N)
+_CLOSES_RE = re.compile(r'\s*(?:Closes|Fixes|Resolves) #')
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -40,7 +45,8 @@ def main():
     print_info(f"Linking PR #{args.pr_number} to issue #{args.issue_number}...")
     
     # Verify PR exists
-    pr = get_pr(args.pr_number)
+    # Read fresh: the body is edited and written back below
+    pr = get_pr(args.pr_number, use_cache=False)
     if not pr:
         print_error(f"Error: PR #{args.pr_number} not found")
         sys.exit(1)
@@ -64,11 +70,7 @@ def main():
     
     # Remove closing keywords
     lines = current_body.split('\n')
-    closing_keywords = ['Closes #', 'Fixes #', 'Resolves #']
-    filtered_lines = [
-        line for line in lines 
-        if not any(line.strip().startswith(kw) for kw in closing_keywords)
-    ]
+    filtered_lines = [line for line in lines if not _CLOSES_RE.match(line)]
     
     # Rejoin and add single closing reference
     new_body = '\n'.join(filtered_lines).rstrip()
@@ -7,19 +7,20 @@ modular rule pack system introduced in AgentsToolkit v2.0.
 Usage: python3 ~/.agentsmd/scripts/migrate_to_packs.py
 """
 
-import json
 import os
 import re
-import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Add lib to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from lib.common import colors, print_error, print_success, print_warning, print_info
+    from lib.common import (
+        colors, print_error, print_success, print_warning, print_info, write_text_atomic
+    )
 except ImportError:
     # Fallback if lib not available
     class colors:
@@ -35,14 +36,157 @@ except ImportError:
     def print_info(msg): print(f"{colors.BLUE}ℹ {msg}{colors.NC}")
 
 
+# Known standard section headers
+STANDARD_SECTIONS = frozenset([
+    '## Prime Directives',
+    '## Issue-First Development',
+    '## Branch Management',
+    '## Screenshot Handling',
+    '## Pull Request Protocol',
+    '## Commit Standards',
+    '## Scope Management',
+    '## Feedback Discipline',
+    '## Walkthrough Documentation',
+    '## GitHub Output',
+    '## Safety & Execution',
+    '## Anti-Patterns'
+])
+_STANDARD_SECTIONS_BYTES = frozenset(header.encode('utf-8') for header in STANDARD_SECTIONS)
+
+# Level-2 markdown headers delimiting AGENTS.md sections
+HEADER_RE = re.compile(rb'^## .*$', re.MULTILINE)
+
+# Counts words without materializing a list of them
+WORD_RE = re.compile(r'\S+')
+
+# Already-migrated files carry this marker within their first few KB
+BEGIN_IMPORTS_MARKER = b'<!-- BEGIN PACK IMPORTS -->'
+MARKER_SCAN_BYTES = 4096
+
+# Size difference beyond which AGENTS.md is considered customized outright
+WHITESPACE_SLACK_BYTES = 64
+
+# Block size for measuring whitespace at the ends of a file
+WHITESPACE_SCAN_BYTES = 4096
+
+
+# Fresh modular AGENTS.md, split around the end-of-imports marker so the
+# custom pack import can be spliced in without rescanning the text
+END_IMPORTS_MARKER = '<!-- END PACK IMPORTS -->'
+CUSTOM_PACK_IMPORT = '\n@rule-packs/custom/custom-rules.md\n\n'
+
+MODULAR_TEMPLATE_HEAD = """# AGENTS.md — Mandatory Agent Behavior & Workflow Standards
+
+Non-negotiable rules for all AI agents. Violations constitute workflow failures.
+
+**Version:** 2.0.0 (Modular Rule Packs)  
+**Reference:** Command examples at [AGENTS_REFERENCE.md](docs/AGENTS_REFERENCE.md).
+
+---
+
+## Active Rule Packs
+
+This configuration loads the following rule packs:
+
+- **Core Workflow Standards** (`rule-packs/core/`) — Universal rules
+- **GitHub Workflow Hygiene** (`rule-packs/github-hygiene/`) — GitHub-specific rules
+
+---
+
+<!-- BEGIN PACK IMPORTS -->
+
+@rule-packs/core/prime-directives.md
+@rule-packs/core/scope-management.md
+@rule-packs/core/feedback-discipline.md
+@rule-packs/core/safety-execution.md
+
+@rule-packs/github-hygiene/issue-first.md
+@rule-packs/github-hygiene/branch-management.md
+@rule-packs/github-hygiene/screenshot-handling.md
+@rule-packs/github-hygiene/pr-protocol.md
+@rule-packs/github-hygiene/commit-standards.md
+@rule-packs/github-hygiene/walkthrough-docs.md
+@rule-packs/github-hygiene/github-output.md
+@rule-packs/github-hygiene/anti-patterns.md
+
+"""
+
+MODULAR_TEMPLATE_TAIL = """
+
+---
+
+## Configuration
+
+**Character Budget:**
+- Core: ~450 words (~2,800 chars)
+- GitHub Hygiene: ~650 words (~4,200 chars)
+- **Total:** ~1,100 words (~7,000 chars)
+"""
+
+
 def get_install_dir() -> Path:
     """Get the AgentsToolkit installation directory."""
     return Path(os.environ.get('AGENTSMD_HOME', Path.home() / '.agentsmd'))
 
 
+def _file_digest(path: Path) -> bytes:
+    """Hash a file in fixed-size chunks without loading it into memory."""
+    import hashlib
+    
+    digest = hashlib.blake2b()
+    with path.open('rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _stripped_size(path: Path, size: int) -> int:
+    """Byte size of a file without its leading and trailing ASCII whitespace.
+    
+    Reads inward from both ends, a block at a time, only until content is found.
+    """
+    with path.open('rb') as f:
+        leading = 0
+        while leading < size:
+            block = f.read(WHITESPACE_SCAN_BYTES)
+            kept = block.lstrip()
+            leading += len(block) - len(kept)
+            if kept or not block:
+                break
+        
+        end = size
+        while end > leading:
+            start = max(leading, end - WHITESPACE_SCAN_BYTES)
+            f.seek(start)
+            block = f.read(end - start)
+            kept = block.rstrip()
+            if kept:
+                end = start + len(kept)
+                break
+            end = start
+    return end - leading
+
+
 def detect_customizations(agents_md: Path, legacy_md: Path) -> bool:
     """Detect if user has customized AGENTS.md beyond the default."""
-    if not agents_md.exists() or not legacy_md.exists():
+    # The stat calls double as the existence check
+    try:
+        current_size = agents_md.stat().st_size
+        legacy_size = legacy_md.stat().st_size
+    except OSError:
+        return False
+    
+    # Surrounding whitespace is ignored below, so only a large size gap between
+    # the stripped contents is conclusive; the ends are measured only when needed
+    if (
+        abs(current_size - legacy_size) > WHITESPACE_SLACK_BYTES
+        and abs(_stripped_size(agents_md, current_size) - _stripped_size(legacy_md, legacy_size))
+        > WHITESPACE_SLACK_BYTES
+    ):
+        return True
+    
+    # Byte-identical files need no decoding or full in-memory comparison
+    if current_size == legacy_size and _file_digest(agents_md) == _file_digest(legacy_md):
         return False
     
     current = agents_md.read_text()
@@ -54,50 +198,40 @@ def detect_customizations(agents_md: Path, legacy_md: Path) -> bool:
 
 def extract_custom_rules(agents_md: Path) -> str:
     """Extract custom rules that aren't in the standard sections."""
-    content = agents_md.read_text()
-    
-    # Known standard section headers
-    standard_sections = [
-        '## Prime Directives',
-        '## Issue-First Development',
-        '## Branch Management',
-        '## Screenshot Handling',
-        '## Pull Request Protocol',
-        '## Commit Standards',
-        '## Scope Management',
-        '## Feedback Discipline',
-        '## Walkthrough Documentation',
-        '## GitHub Output',
-        '## Safety & Execution',
-        '## Anti-Patterns'
-    ]
-    
-    # Find any additional sections
-    lines = content.split('\n')
-    custom_sections = []
-    in_custom = False
-    current_section = []
+    # Markers are ASCII, so scan raw bytes and decode only the kept sections
+    content = agents_md.read_bytes()
+    if b'\r' in content:
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     
-    for line in lines:
-        if line.startswith('## '):
-            if in_custom and current_section:
-                custom_sections.append('\n'.join(current_section))
-            
-            # Check if this is a standard section
-            is_standard = any(line.startswith(s) for s in standard_sections)
-            in_custom = not is_standard
-            current_section = [line] if in_custom else []
-        elif in_custom:
-            current_section.append(line)
+    # Locate every section header in one scan; each section runs up to the next
+    headers = list(HEADER_RE.finditer(content))
+    custom_sections = []
     
-    if in_custom and current_section:
-        custom_sections.append('\n'.join(current_section))
+    for header, following in zip(headers, headers[1:] + [None]):
+        # Check if this is a standard section (exact header match)
+        if header.group().rstrip() in _STANDARD_SECTIONS_BYTES:
+            continue
+        if following:
+            # Drop the newline that ends the line before the next header
+            custom_sections.append(content[header.start():following.start() - 1])
+        else:
+            # The final section runs to end of file, trailing newline included
+            custom_sections.append(content[header.start():])
     
-    return '\n\n'.join(custom_sections)
+    return b'\n\n'.join(custom_sections).decode('utf-8')
 
 
-def create_custom_pack(install_dir: Path, custom_content: str) -> bool:
-    """Create a custom pack from extracted rules."""
+def create_custom_pack(
+    install_dir: Path,
+    custom_content: str,
+    now: Optional[datetime] = None
+) -> bool:
+    """Create a custom pack from extracted rules.
+    
+    `now` is the migration timestamp shared with the backup (defaults to now).
+    """
+    import json
+    
     packs_dir = install_dir / 'rule-packs'
     custom_dir = packs_dir / 'custom'
     custom_dir.mkdir(parents=True, exist_ok=True)
@@ -112,26 +246,24 @@ def create_custom_pack(install_dir: Path, custom_content: str) -> bool:
         "targetAgents": ["*"],
         "files": ["custom-rules.md"],
         "metadata": {
-            "wordCount": len(custom_content.split()),
+            "wordCount": sum(1 for _ in WORD_RE.finditer(custom_content)),
             "characterCount": len(custom_content),
             "category": "workflow",
             "tags": ["custom", "migrated"]
         }
     }
     
-    with open(custom_dir / 'pack.json', 'w') as f:
-        json.dump(pack_json, f, indent=2)
+    write_text_atomic(custom_dir / 'pack.json', json.dumps(pack_json, indent=2))
     
     # Create custom rules markdown
     custom_md = f"""# Custom Rules
 
-*Migrated from legacy AGENTS.md on {datetime.now().strftime('%Y-%m-%d')}*
+*Migrated from legacy AGENTS.md on {(now or datetime.now()).strftime('%Y-%m-%d')}*
 
 {custom_content}
 """
     
-    with open(custom_dir / 'custom-rules.md', 'w') as f:
-        f.write(custom_md)
+    write_text_atomic(custom_dir / 'custom-rules.md', custom_md)
     
     return True
 
@@ -141,80 +273,34 @@ def update_agents_md_imports(install_dir: Path, include_custom: bool = False) ->
     agents_md = install_dir / 'AGENTS.md'
     modular_md = install_dir / 'AGENTS.modular.md'
     
-    # If we have a modular template, use it
-    if modular_md.exists():
-        content = modular_md.read_text()
+    # If we have a modular template, use it; split once around the end marker
+    if os.access(modular_md, os.F_OK):
+        head, marker, tail = modular_md.read_text().partition(END_IMPORTS_MARKER)
     else:
-        # Generate fresh modular AGENTS.md
-        content = """# AGENTS.md — Mandatory Agent Behavior & Workflow Standards
-
-Non-negotiable rules for all AI agents. Violations constitute workflow failures.
-
-**Version:** 2.0.0 (Modular Rule Packs)  
-**Reference:** Command examples at [AGENTS_REFERENCE.md](docs/AGENTS_REFERENCE.md).
-
----
-
-## Active Rule Packs
-
-This configuration loads the following rule packs:
-
-- **Core Workflow Standards** (`rule-packs/core/`) — Universal rules
-- **GitHub Workflow Hygiene** (`rule-packs/github-hygiene/`) — GitHub-specific rules
-
----
-
-<!-- BEGIN PACK IMPORTS -->
-
-@rule-packs/core/prime-directives.md
-@rule-packs/core/scope-management.md
-@rule-packs/core/feedback-discipline.md
-@rule-packs/core/safety-execution.md
-
-@rule-packs/github-hygiene/issue-first.md
-@rule-packs/github-hygiene/branch-management.md
-@rule-packs/github-hygiene/screenshot-handling.md
-@rule-packs/github-hygiene/pr-protocol.md
-@rule-packs/github-hygiene/commit-standards.md
-@rule-packs/github-hygiene/walkthrough-docs.md
-@rule-packs/github-hygiene/github-output.md
-@rule-packs/github-hygiene/anti-patterns.md
-
-<!-- END PACK IMPORTS -->
-
----
-
-## Configuration
-
-**Character Budget:**
-- Core: ~450 words (~2,800 chars)
-- GitHub Hygiene: ~650 words (~4,200 chars)
-- **Total:** ~1,100 words (~7,000 chars)
-"""
+        head, marker, tail = MODULAR_TEMPLATE_HEAD, END_IMPORTS_MARKER, MODULAR_TEMPLATE_TAIL
     
     # Add custom pack import if needed
-    if include_custom:
-        content = content.replace(
-            '<!-- END PACK IMPORTS -->',
-            '\n@rule-packs/custom/custom-rules.md\n\n<!-- END PACK IMPORTS -->'
-        )
-    
-    with open(agents_md, 'w') as f:
-        f.write(content)
+    custom_import = CUSTOM_PACK_IMPORT if include_custom and marker else ''
+    write_text_atomic(agents_md, head, custom_import, marker, tail)
     
     return True
 
 
-def backup_current_config(install_dir: Path) -> Path:
-    """Create a backup of current configuration."""
+def backup_current_config(install_dir: Path, now: Optional[datetime] = None) -> Path:
+    """Create a backup of current configuration.
+    
+    `now` is the migration timestamp shared with the custom pack (defaults to now).
+    """
+    import shutil
+    
     backup_dir = install_dir / 'backups'
     backup_dir.mkdir(exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = (now or datetime.now()).strftime('%Y%m%d_%H%M%S')
     backup_path = backup_dir / f'AGENTS.md.{timestamp}.bak'
     
     agents_md = install_dir / 'AGENTS.md'
-    if agents_md.exists():
+    if os.access(agents_md, os.F_OK):
         shutil.copy2(agents_md, backup_path)
     
     return backup_path
@@ -228,20 +314,30 @@ def main():
     print()
     
     install_dir = get_install_dir()
+    now = datetime.now()  # One timestamp for the whole migration run
     agents_md = install_dir / 'AGENTS.md'
     legacy_md = install_dir / 'AGENTS.legacy.md'
     packs_dir = install_dir / 'rule-packs'
     
-    # Check if already using modular packs
-    if agents_md.exists():
-        content = agents_md.read_text()
-        if '<!-- BEGIN PACK IMPORTS -->' in content:
+    # One directory read answers every existence check below
+    try:
+        with os.scandir(install_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+    
+    # Check if already using modular packs (the marker sits near the top)
+    if agents_md.name in entries:
+        with agents_md.open('rb') as f:
+            head = f.read(MARKER_SCAN_BYTES)
+        if BEGIN_IMPORTS_MARKER in head:
             print_success("Already using modular rule packs!")
             print_info("No migration needed.")
             return 0
     
     # Check if rule packs exist
-    if not packs_dir.exists():
+    packs_entry = entries.get(packs_dir.name)
+    if packs_entry is None or not packs_entry.is_dir():
         print_error(f"Rule packs not found at {packs_dir}")
         print_info("Please run install.py to set up the toolkit first.")
         return 1
@@ -250,7 +346,11 @@ def main():
     print()
     
     # Detect customizations
-    has_customizations = detect_customizations(agents_md, legacy_md)
+    has_customizations = (
+        agents_md.name in entries
+        and legacy_md.name in entries
+        and detect_customizations(agents_md, legacy_md)
+    )
     
     if has_customizations:
         print_warning("Customizations detected in your AGENTS.md")
@@ -262,7 +362,7 @@ def main():
             
             if custom_content.strip():
                 print_info("Extracting custom rules...")
-                create_custom_pack(install_dir, custom_content)
+                create_custom_pack(install_dir, custom_content, now)
                 print_success("Created custom pack at rule-packs/custom/")
             else:
                 print_info("No custom sections found to extract.")
@@ -270,7 +370,7 @@ def main():
     
     # Create backup
     print_info("Creating backup...")
-    backup_path = backup_current_config(install_dir)
+    backup_path = backup_current_config(install_dir, now)
     print_success(f"Backup saved to {backup_path}")
     
     # Update AGENTS.md
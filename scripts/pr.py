@@ -61,34 +61,45 @@ def validate_branch_ready(branch, base):
     return True
 
 
-def generate_pr_title(issue_num, branch):
+def generate_pr_title(issue_num, branch, issue):
     """Generate PR title from issue or branch.
     
+    Args:
+        issue_num: Linked issue number, if any
+        branch: Current branch name
+        issue: Issue dict already fetched by the caller, or None if not found
+    
     Returns:
         PR title string
     """
-    if issue_num:
-        issue = get_issue(issue_num)
-        if issue:
-            return f"#{issue_num}: {issue['title']}"
+    if issue_num and issue:
+        return f"#{issue_num}: {issue['title']}"
     
     # Use branch name as fallback
     return branch.replace('-', ' ').replace('_', ' ').title()
 
 
-def get_commit_list(branch, base):
+def get_commit_list(branch, base, limit=10):
     """Get list of commits for PR description.
     
+    Args:
+        branch: Head branch name
+        base: Base branch name
+        limit: Maximum number of commits to return
+    
     Returns:
-        List of commit messages
+        List of commit messages (newest first)
     """
-    result = run_git('log', '--oneline', f'{base}..{branch}')
+    # Let git stop after `limit` commits instead of formatting the whole range
+    result = run_git('log', '--oneline', '-n', str(limit), f'{base}..{branch}')
     if result.returncode == 0 and result.stdout:
         commits = []
         for line in result.stdout.strip().split('\n'):
-            if line:
-                # Remove commit hash, keep message
-                commits.append(line.split(' ', 1)[1] if ' ' in line else line)
+            if not line:
+                continue
+            # Remove commit hash, keep message
+            _, sep, message = line.partition(' ')
+            commits.append(message if sep else line)
         return commits
     return []
 
@@ -126,9 +137,11 @@ def main():
     print_info("Detecting associated issue...")
     issue_num = args.issue_number or get_issue_from_branch(branch)
     
+    # Fetch the issue once; reused for validation, title, and summary
+    issue = get_issue(issue_num) if issue_num else None
+    
     if issue_num:
         # Verify issue exists and is open
-        issue = get_issue(issue_num)
         if issue:
             issue_state = issue.get('state', '').upper()
             if issue_state != 'OPEN':
@@ -150,27 +163,25 @@ def main():
     
     # Generate PR content
     print_info("Generating PR content...")
-    pr_title = generate_pr_title(issue_num, branch)
+    pr_title = generate_pr_title(issue_num, branch, issue)
     
     # Get issue summary if available
     summary = ""
-    if issue_num:
-        issue = get_issue(issue_num)
-        if issue and issue.get('body'):
-            # Use first paragraph of issue body as summary
-            summary = issue['body'].split('\n\n')[0][:500]
+    if issue and issue.get('body'):
+        # Use first paragraph of issue body as summary
+        summary = issue['body'].split('\n\n')[0][:500]
     
     if not summary:
         summary = pr_title
     
-    # Get commit list
-    commits = get_commit_list(branch, base_branch)
+    # Get commit list (first 10 commits)
+    commits = get_commit_list(branch, base_branch, limit=10)
     
     # Format PR body
     pr_body = format_pr_body(
         issue_num=issue_num,
         summary=summary,
-        changes=commits[:10]  # Limit to first 10 commits
+        changes=commits
     )
     
     print_success(f"✓ PR Title: {pr_title}")
@@ -15,8 +15,9 @@ Options:
 """
 
 import argparse
-import shutil
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add lib to path
@@ -24,10 +25,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from lib.common import (
     colors, print_error, print_success, print_warning, print_info,
-    check_git_repo, get_repo_root
+    check_git_repo, get_repo_root, check_gh_auth_status, run_git, get_repo_info
 )
 from lib.github import (
-    get_repo_info, get_repo_default_branch, check_admin_access,
+    get_repo_default_branch, check_admin_access,
     enable_branch_protection, is_branch_protected, get_branch_protection
 )
 
@@ -60,10 +61,8 @@ def check_prerequisites() -> bool:
         print_error("Error: Not in a git repository")
         return False
     
-    # Check gh auth
-    import subprocess
-    result = subprocess.run(['gh', 'auth', 'status'], capture_output=True)
-    if result.returncode != 0:
+    # Check gh auth (cached briefly across invocations)
+    if not check_gh_auth_status():
         print_error("Error: GitHub CLI not authenticated")
         print_info("Run: gh auth login")
         return False
@@ -84,12 +83,12 @@ def install_github_action(repo_root: Path) -> bool:
     
     # Find toolkit directory
     toolkit_dir = Path.home() / '.agents_toolkit'
-    if not toolkit_dir.exists():
+    if not os.access(toolkit_dir, os.F_OK):
         print_error(f"Error: Toolkit not found at {toolkit_dir}")
         return False
     
     template_file = toolkit_dir / 'templates' / 'pr-issue-check.yml'
-    if not template_file.exists():
+    if not os.access(template_file, os.F_OK):
         print_error(f"Error: Template not found at {template_file}")
         return False
     
@@ -99,26 +98,30 @@ def install_github_action(repo_root: Path) -> bool:
     
     target_file = workflows_dir / 'pr-issue-check.yml'
     
-    if target_file.exists():
+    if os.access(target_file, os.F_OK):
         print_warning("⚠️  pr-issue-check.yml already exists")
         response = input("Overwrite? (y/N): ").strip().lower()
         if response != 'y':
             print_warning("⊘ Skipped - keeping existing workflow")
             return True
     
-    # Copy template
-    shutil.copy2(template_file, target_file)
+    import shutil
+    
+    # Copy template contents only; metadata is irrelevant for a committed file.
+    # Stage next to the target and rename so an interrupted copy leaves no partial file.
+    tmp_file = target_file.with_name(target_file.name + '.tmp')
+    shutil.copyfile(template_file, tmp_file)
+    os.replace(tmp_file, target_file)
     print_success(f"✓ Created .github/workflows/pr-issue-check.yml")
     
     # Commit the workflow file
     print_info("Committing workflow file...")
-    import subprocess
     
-    subprocess.run(['git', 'add', str(target_file)], cwd=repo_root)
-    result = subprocess.run(
-        ['git', 'commit', '-m', 'Add PR issue link check workflow'],
-        cwd=repo_root,
-        capture_output=True
+    # Commit only the workflow file, leaving any other staged changes alone
+    run_git('add', '--', str(target_file), cwd=repo_root)
+    result = run_git(
+        'commit', '-m', 'Add PR issue link check workflow', '--', str(target_file),
+        cwd=repo_root
     )
     
     if result.returncode == 0:
@@ -126,7 +129,8 @@ def install_github_action(repo_root: Path) -> bool:
         print_info("Run 'git push' to activate the workflow")
     else:
         # Check if it's already committed
-        if b'nothing to commit' in result.stdout or b'nothing to commit' in result.stderr:
+        output = result.stdout + result.stderr
+        if 'nothing to commit' in output or 'nothing added to commit' in output:
             print_info("Workflow file already committed")
         else:
             print_warning("⚠️  Manual commit required: git add .github/workflows/pr-issue-check.yml")
@@ -142,21 +146,29 @@ def main():
     if not check_prerequisites():
         sys.exit(1)
     
-    # Get repo info
+    # Repository lookups are independent network round-trips; run them concurrently
     print_info("Checking repository...")
-    repo_info = get_repo_info()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        repo_info_future = executor.submit(get_repo_info)
+        admin_future = executor.submit(check_admin_access)
+        default_branch_future = (
+            None if args.branch else executor.submit(get_repo_default_branch)
+        )
+    
+    # Get repo info
+    repo_info = repo_info_future.result()
     if not repo_info:
         print_error("Error: Failed to get repository information")
         sys.exit(1)
     
-    owner = repo_info['owner']['login']
+    owner = repo_info['owner']
     name = repo_info['name']
-    repo_url = repo_info['url']
+    repo_url = f"https://github.com/{owner}/{name}"
     
     print_success(f"✓ Repository: {owner}/{name}")
     
     # Check admin access
-    if not check_admin_access():
+    if not admin_future.result():
         print_error("Error: You do not have admin access to this repository")
         print_info("Branch protection requires admin permissions")
         sys.exit(1)
@@ -167,7 +179,7 @@ def main():
     if args.branch:
         branch = args.branch
     else:
-        branch = get_repo_default_branch()
+        branch = default_branch_future.result()
         print_info(f"Auto-detected default branch: {branch}")
     
     # Check if already protected
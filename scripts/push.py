@@ -5,6 +5,7 @@ Commits current changes with AGENTS.md format and pushes to remote.
 """
 
 import argparse
+import re
 import sys
 from pathlib import Path
 
@@ -12,10 +13,37 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from lib.common import (
-    colors, print_error, print_success, print_info, print_warning,
+    yellow, print_error, print_success, print_info, print_warning,
     check_git_repo, get_current_branch, run_git
 )
-from lib.github import get_issue_from_branch, check_pr_exists
+from lib.github import get_issue_from_branch, check_pr_exists, get_pr
+
+
+# `git commit` summary line: "[branch abc1234] message" (or "[branch (root-commit) abc1234]")
+_COMMIT_SUMMARY_RE = re.compile(r'^\[[^\]]* ([0-9a-f]{4,})\]', re.MULTILINE)
+
+# `git push --porcelain` ref line: "<flag>\t<src>:refs/heads/<branch>\t<summary>"
+_PUSH_REF_RE = re.compile(
+    r'^(?P<flag>.)\t[^\t]*:refs/heads/(?P<branch>[^\t]+)\t(?P<summary>.*)$', re.MULTILINE
+)
+
+
+def parse_push_result(output, branch):
+    """Find the ref status for a branch in `git push --porcelain` output.
+    
+    Args:
+        output: stdout of `git push --porcelain`
+        branch: Pushed branch name
+        
+    Returns:
+        Tuple of (flag, summary), e.g. (' ', 'abc1234..def5678'),
+        ('*', '[new branch]') or ('!', '[rejected] (non-fast-forward)');
+        (None, None) if the branch is not listed
+    """
+    for match in _PUSH_REF_RE.finditer(output):
+        if match.group('branch') == branch:
+            return match.group('flag'), match.group('summary')
+    return None, None
 
 
 def parse_args():
@@ -38,6 +66,11 @@ def parse_args():
         action='store_true',
         help='Skip git hooks (use with caution)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query GitHub instead of reusing recent PR lookups'
+    )
     return parser.parse_args()
 
 
@@ -65,24 +98,22 @@ def main():
     # Detect issue number
     issue_num = get_issue_from_branch(branch)
     
-    # Check for uncommitted changes
-    result = run_git('status', '--porcelain')
-    if not result.stdout.strip():
+    # Check for uncommitted changes (one working-tree scan, reused for display)
+    status = run_git('status', '--porcelain=v1').stdout
+    if not status.strip():
         print_warning("No changes to commit")
         sys.exit(0)
     
-    # Show what will be committed
+    # Show what will be committed (porcelain v1 is the short format)
     print_info("Changes to commit:")
-    result = run_git('status', '--short')
-    if result.stdout:
-        print(result.stdout)
+    print(status)
     
     # Get commit message
     if args.message:
         commit_message = args.message
     else:
         print()
-        commit_message = input(f"{colors.YELLOW}Commit message:{colors.NC} ").strip()
+        commit_message = input(f"{yellow('Commit message:')} ").strip()
         if not commit_message:
             print_error("Error: Commit message is required")
             sys.exit(1)
@@ -124,33 +155,42 @@ def main():
             print_error(result.stderr)
         sys.exit(1)
     
-    # Get commit hash
-    result = run_git('rev-parse', '--short', 'HEAD')
-    commit_hash = result.stdout.strip() if result.returncode == 0 else 'unknown'
+    # Get commit hash from the commit summary line, avoiding another git spawn
+    match = _COMMIT_SUMMARY_RE.search(result.stdout)
+    if match:
+        commit_hash = match.group(1)
+    else:
+        result = run_git('rev-parse', '--short', 'HEAD')
+        commit_hash = result.stdout.strip() if result.returncode == 0 else 'unknown'
     
     print_success(f"✓ Committed: {commit_hash}")
     
     # Push to remote
     print()
     print_info(f"Pushing to origin/{branch}...")
-    result = run_git('push', '-u', 'origin', branch)
+    result = run_git('push', '--porcelain', '-u', 'origin', branch)
+    flag, push_summary = parse_push_result(result.stdout, branch)
     
-    if result.returncode != 0:
+    if result.returncode != 0 or flag == '!':
         print_error("Error: Failed to push")
+        if push_summary:
+            print_error(push_summary)
         if result.stderr:
             print_error(result.stderr)
         sys.exit(1)
     
-    print_success(f"✓ Pushed to origin/{branch}")
+    # The porcelain ref line carries the pushed range; no follow-up query needed
+    if push_summary:
+        print_success(f"✓ Pushed to origin/{branch} ({push_summary})")
+    else:
+        print_success(f"✓ Pushed to origin/{branch}")
     
     # Check for PR
-    pr_num = check_pr_exists(branch, 'main')
-    if not pr_num:
-        pr_num = check_pr_exists(branch, 'master')
+    # One lookup regardless of whether the repo uses main or master
+    pr_num = check_pr_exists(branch, base=None, use_cache=not args.no_cache)
     
     if pr_num:
-        from lib.github import get_pr
-        pr = get_pr(pr_num)
+        pr = get_pr(pr_num, use_cache=not args.no_cache)
         if pr:
             pr_url = pr.get('url', '')
             print()
@@ -158,7 +198,7 @@ def main():
             print_info(f"   {pr_url}")
     
     print()
-    print_success(f"{colors.GREEN}✓ Push complete!{colors.NC}")
+    print_success("✓ Push complete!")
     print_info(f"Commit: {commit_hash}")
     if issue_num:
         print_info(f"Issue: #{issue_num}")
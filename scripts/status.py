@@ -2,8 +2,11 @@
 """status.py - Show current workflow status.
 
 Shows: branch, linked issue, commits, PR status
+
+Usage: status.py [--no-cache]
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -11,24 +14,40 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from lib.common import (
-    colors, print_error, print_info, check_git_repo,
-    get_current_branch, run_git
+    blue, green, yellow, print_field, print_error, print_info, check_git_repo,
+    get_status_v2, run_git
 )
 from lib.github import (
-    get_issue, get_issue_from_branch, check_pr_exists,
+    get_issue, get_issue_from_branch, check_pr_exists, get_pr,
     get_commits_ahead, is_branch_pushed
 )
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Show current workflow status'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query GitHub instead of reusing recent PR lookups'
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main status display."""
+    args = parse_args()
+    
     # Check if in git repository
     if not check_git_repo():
         print_error("Error: Not in a git repository")
         sys.exit(1)
     
-    # Get current branch
-    branch = get_current_branch()
+    # Branch and upstream tracking state from a single git status call
+    status = get_status_v2()
+    branch = status['branch'] if status else None
     if not branch:
         print_error("Error: No current branch found")
         sys.exit(1)
@@ -36,42 +55,41 @@ def main():
     # Get linked issue from git config or branch name
     issue_num = get_issue_from_branch(branch)
     
-    print(f"{colors.BLUE}📋 Current Workflow Status{colors.NC}")
+    print(blue("📋 Current Workflow Status"))
     print("─────────────────────────────")
-    print(f"{colors.BLUE}Branch:{colors.NC} {branch}")
+    print_field("Branch", branch)
     
     # Display issue information
     if issue_num:
-        print(f"{colors.BLUE}Linked Issue:{colors.NC} #{issue_num}")
+        print_field("Linked Issue", f"#{issue_num}")
         issue = get_issue(issue_num)
         if issue:
             issue_state = issue.get('state', 'unknown')
-            print(f"{colors.BLUE}Issue State:{colors.NC} {issue_state}")
+            print_field("Issue State", issue_state)
     else:
-        print(f"{colors.BLUE}Linked Issue:{colors.NC} None (standalone branch)")
+        print_field("Linked Issue", "None (standalone branch)")
     
-    # Check commits ahead of main
-    commits_ahead = get_commits_ahead(branch, 'main')
-    if commits_ahead == 0:
-        # Try master
-        commits_ahead = get_commits_ahead(branch, 'master')
-    print(f"{colors.BLUE}Commits ahead:{colors.NC} {commits_ahead}")
+    # Check commits ahead of main (or master when there is no main)
+    has_main = run_git('rev-parse', '--verify', '--quiet', 'refs/heads/main').returncode == 0
+    base = 'main' if has_main else 'master'
+    commits_ahead = get_commits_ahead(branch, base)
+    print_field("Commits ahead", commits_ahead)
     
-    # Check if pushed
-    if is_branch_pushed(branch):
-        print(f"{colors.BLUE}Pushed:{colors.NC} ✅ Yes")
+    # Check if pushed (a live origin/<branch> upstream means it is on the remote;
+    # any other upstream, e.g. origin/main after `checkout -b x origin/main`, proves nothing)
+    pushed = status['upstream'] == f'origin/{branch}' and status['ahead'] is not None
+    if pushed or is_branch_pushed(branch):
+        print_field("Pushed", "✅ Yes")
     else:
-        print(f"{colors.BLUE}Pushed:{colors.NC} ❌ No - run 'git push'")
+        print_field("Pushed", "❌ No - run 'git push'")
     
     # Check for existing PR
-    pr_num = check_pr_exists(branch, 'main')
-    if not pr_num:
-        pr_num = check_pr_exists(branch, 'master')
+    # One lookup regardless of whether the repo uses main or master
+    pr_num = check_pr_exists(branch, base=None, use_cache=not args.no_cache)
     
     if pr_num:
-        from lib.github import get_pr
-        pr = get_pr(pr_num)
-        print(f"{colors.BLUE}PR:{colors.NC} #{pr_num}")
+        pr = get_pr(pr_num, use_cache=not args.no_cache)
+        print_field("PR", f"#{pr_num}")
         
         if pr:
             state = pr.get('state', '').upper()
@@ -79,22 +97,22 @@ def main():
             is_merged = pr.get('merged', False)
             
             if is_merged:
-                print(f"{colors.GREEN}✅ Merged!{colors.NC}")
+                print(green("✅ Merged!"))
             elif state == 'CLOSED':
-                print(f"{colors.YELLOW}⚠️  Closed without merge{colors.NC}")
+                print(yellow("⚠️  Closed without merge"))
             elif is_draft:
-                print(f"{colors.BLUE}📋 Draft PR{colors.NC}")
+                print(blue("📋 Draft PR"))
             else:
-                print(f"{colors.BLUE}📋 Open{colors.NC}")
+                print(blue("📋 Open"))
         else:
-            print(f"{colors.BLUE}📋 PR open{colors.NC}")
+            print(blue("📋 PR open"))
     else:
         if commits_ahead > 0:
-            print(f"{colors.BLUE}PR:{colors.NC} None - run 'pr.py' to create")
-            print(f"{colors.BLUE}📋 Next step: pr.py{colors.NC}")
+            print_field("PR", "None - run 'pr.py' to create")
+            print(blue("📋 Next step: pr.py"))
         else:
-            print(f"{colors.BLUE}PR:{colors.NC} None (no commits yet)")
-            print(f"{colors.BLUE}📋 Next step: Make changes and commit{colors.NC}")
+            print_field("PR", "None (no commits yet)")
+            print(blue("📋 Next step: Make changes and commit"))
     
     sys.exit(0)
 
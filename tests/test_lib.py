@@ -16,69 +16,167 @@ from lib.common import (
 )
 
 
+_SANITIZE_CASES = (
+    ("Fix: Login Bug!", "fix-login-bug"),
+    ("Add User Authentication", "add-user-authentication"),
+    ("Update docs (README)", "update-docs-readme"),
+)
+
+_BRANCH_TYPE_CASES = (
+    ("Fix login bug", "fix"),
+    ("Broken authentication", "fix"),
+    ("Error in API", "fix"),
+    ("Add user profile", "feat"),
+    ("Create new dashboard", "feat"),
+    ("Implement feature X", "feat"),
+    ("Update documentation", "docs"),
+    ("Docs for API", "docs"),
+    ("Refactor authentication", "refactor"),
+    ("Cleanup old code", "refactor"),
+    ("Update dependencies", "chore"),
+    ("Bump version", "chore"),
+    ("Add unit tests", "test"),
+    ("Testing framework", "test"),
+)
+
+_FORMAT_BRANCH_CASES = (
+    # With issue number
+    (("feat", "add-authentication", 42), "feat/42-add-authentication"),
+    # Without issue number (pending)
+    (("fix", "login-bug", None), "fix/pending-login-bug"),
+    # Different types
+    (("docs", "update-readme", 123), "docs/123-update-readme"),
+)
+
+
 class TestCommon(unittest.TestCase):
     """Test common module functions."""
     
-    def test_sanitize_branch_name(self):
-        """Test branch name sanitization."""
-        self.assertEqual(
-            sanitize_branch_name("Fix: Login Bug!"),
-            "fix-login-bug"
-        )
-        self.assertEqual(
-            sanitize_branch_name("Add User Authentication"),
-            "add-user-authentication"
-        )
-        self.assertEqual(
-            sanitize_branch_name("Update docs (README)"),
-            "update-docs-readme"
+    def test_branch_helpers(self):
+        """Test branch name sanitization, type detection, and formatting."""
+        cases = (
+            (sanitize_branch_name, [((title,), expected) for title, expected in _SANITIZE_CASES]),
+            (detect_branch_type, [((title,), expected) for title, expected in _BRANCH_TYPE_CASES]),
+            (format_branch_name, _FORMAT_BRANCH_CASES),
         )
-        # Test length limiting
-        long_name = "a" * 100
-        result = sanitize_branch_name(long_name, max_length=50)
-        self.assertEqual(len(result), 50)
-    
-    def test_detect_branch_type(self):
-        """Test branch type detection from title."""
-        self.assertEqual(detect_branch_type("Fix login bug"), "fix")
-        self.assertEqual(detect_branch_type("Broken authentication"), "fix")
-        self.assertEqual(detect_branch_type("Error in API"), "fix")
-        
-        self.assertEqual(detect_branch_type("Add user profile"), "feat")
-        self.assertEqual(detect_branch_type("Create new dashboard"), "feat")
-        self.assertEqual(detect_branch_type("Implement feature X"), "feat")
-        
-        self.assertEqual(detect_branch_type("Update documentation"), "docs")
-        self.assertEqual(detect_branch_type("Docs for API"), "docs")
-        
-        self.assertEqual(detect_branch_type("Refactor authentication"), "refactor")
-        self.assertEqual(detect_branch_type("Cleanup old code"), "refactor")
-        
-        self.assertEqual(detect_branch_type("Update dependencies"), "chore")
-        self.assertEqual(detect_branch_type("Bump version"), "chore")
+        for func, func_cases in cases:
+            for args, expected in func_cases:
+                with self.subTest(func=func.__name__, args=args):
+                    self.assertEqual(func(*args), expected)
         
-        self.assertEqual(detect_branch_type("Add unit tests"), "test")
-        self.assertEqual(detect_branch_type("Testing framework"), "test")
+        # Test length limiting
+        with self.subTest(func='sanitize_branch_name', max_length=50):
+            result = sanitize_branch_name("a" * 100, max_length=50)
+            self.assertEqual(len(result), 50)
     
-    def test_format_branch_name(self):
-        """Test branch name formatting per AGENTS.md."""
-        # With issue number
-        self.assertEqual(
-            format_branch_name("feat", "add-authentication", 42),
-            "feat/42-add-authentication"
-        )
-        
-        # Without issue number (pending)
-        self.assertEqual(
-            format_branch_name("fix", "login-bug", None),
-            "fix/pending-login-bug"
-        )
+    def test_colors_disabled(self):
+        """Test disabled colors produce no escape sequences."""
+        from lib.common import Colors
         
-        # Different types
-        self.assertEqual(
-            format_branch_name("docs", "update-readme", 123),
-            "docs/123-update-readme"
-        )
+        plain = Colors(enabled=False)
+        self.assertEqual(f"{plain.BLUE}Branch:{plain.NC}", "Branch:")
+        self.assertTrue(Colors(enabled=True).RED.startswith('\033['))
+
+    def test_write_text_atomic_through_symlink(self):
+        """Test atomic writes go through symlinks and keep the file mode."""
+        from lib.common import write_text_atomic
+        from lib.symlinks import is_windows
+        import os
+        import stat
+        import tempfile
+
+        if is_windows():
+            self.skipTest("Unix symlinks and modes")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            real = tmp_path / "real.json"
+            real.write_text("{}")
+            os.chmod(real, 0o644)
+            link = tmp_path / "settings.json"
+            os.symlink(real, link)
+
+            write_text_atomic(link, '{"a": ', '1}')
+
+            self.assertTrue(link.is_symlink())
+            self.assertEqual(real.read_text(), '{"a": 1}')
+            self.assertEqual(stat.S_IMODE(real.stat().st_mode), 0o644)
+            self.assertEqual(sorted(p.name for p in tmp_path.iterdir()), ["real.json", "settings.json"])
+
+
+_STATUS_V2_CASES = (
+    # Tracking branch that has diverged from its upstream
+    ("# branch.oid 7125708\n# branch.head feat/1-x\n"
+     "# branch.upstream origin/feat/1-x\n# branch.ab +2 -1\n",
+     {'branch': 'feat/1-x', 'upstream': 'origin/feat/1-x',
+      'ahead': 2, 'behind': 1, 'dirty': False}),
+    # Detached HEAD with a tracked change
+    ("# branch.oid 7125708\n# branch.head (detached)\n"
+     "1 .M N... 100644 100644 100644 78981922 78981922 a\n",
+     {'branch': None, 'upstream': None, 'ahead': None, 'behind': None, 'dirty': True}),
+    # No upstream configured
+    ("# branch.oid 7125708\n# branch.head main\n",
+     {'branch': 'main', 'upstream': None, 'ahead': None, 'behind': None, 'dirty': False}),
+    # Upstream configured but gone from the remote: no branch.ab line
+    ("# branch.oid 7125708\n# branch.head feat/2-y\n# branch.upstream origin/feat/2-y\n",
+     {'branch': 'feat/2-y', 'upstream': 'origin/feat/2-y',
+      'ahead': None, 'behind': None, 'dirty': False}),
+)
+
+_PUSH_RESULT_CASES = (
+    ("To github.com:me/tool.git\n"
+     "!\tHEAD:refs/heads/feat/1-x\t[rejected] (non-fast-forward)\nDone\n",
+     'feat/1-x', ('!', '[rejected] (non-fast-forward)')),
+    ("To github.com:me/tool.git\n*\tHEAD:refs/heads/feat/1-x\t[new branch]\nDone\n",
+     'feat/1-x', ('*', '[new branch]')),
+    ("To github.com:me/tool.git\n"
+     " \trefs/heads/feat/1-x:refs/heads/feat/1-x\tabc1234..def5678\nDone\n",
+     'feat/1-x', (' ', 'abc1234..def5678')),
+    # Only other refs listed
+    ("To github.com:me/tool.git\n*\tHEAD:refs/heads/feat/2-y\t[new branch]\nDone\n",
+     'feat/1-x', (None, None)),
+)
+
+_COMMIT_SUMMARY_CASES = (
+    ("[feat/1-x 1a2b3c4] Add login\n 1 file changed\n", '1a2b3c4'),
+    ("[main (root-commit) f716982] init\n 1 file changed\n", 'f716982'),
+    ("[detached HEAD 1a2b3c4] Fix typo\n", '1a2b3c4'),
+)
+
+
+class TestGitParsers(unittest.TestCase):
+    """Test parsers for git status, push, and commit output."""
+
+    def test_get_status_v2(self):
+        """Test porcelain v2 branch headers and entries are parsed."""
+        from lib import common
+        from unittest import mock
+        import subprocess
+
+        for output, expected in _STATUS_V2_CASES:
+            with self.subTest(output=output):
+                result = subprocess.CompletedProcess([], 0, stdout=output, stderr='')
+                with mock.patch.object(common, 'run_git', return_value=result):
+                    self.assertEqual(common.get_status_v2(), expected)
+
+        failed = subprocess.CompletedProcess([], 128, stdout='', stderr='not a git repository')
+        with mock.patch.object(common, 'run_git', return_value=failed):
+            self.assertIsNone(common.get_status_v2())
+
+    def test_parse_push_result(self):
+        """Test the pushed branch's ref status is found in porcelain output."""
+        from push import parse_push_result
+
+        for output, branch, expected in _PUSH_RESULT_CASES:
+            with self.subTest(output=output):
+                self.assertEqual(parse_push_result(output, branch), expected)
+
+    def test_commit_summary_hash(self):
+        """Test the new commit hash is read from the commit summary line."""
+        from push import _COMMIT_SUMMARY_RE
+
+        for output, expected in _COMMIT_SUMMARY_CASES:
+            with self.subTest(output=output):
+                self.assertEqual(_COMMIT_SUMMARY_RE.search(output).group(1), expected)
 
 
 class TestSymlinks(unittest.TestCase):
@@ -92,6 +190,58 @@ class TestSymlinks(unittest.TestCase):
         # Should return True on Windows, False otherwise
         expected = platform.system() == 'Windows'
         self.assertEqual(is_windows(), expected)
+    
+    def test_check_symlink_support_unix(self):
+        """Test symlink support is reported without probing on Unix."""
+        from lib.symlinks import check_symlink_support, is_windows
+        
+        if is_windows():
+            self.skipTest("Unix-only fast path")
+        self.assertEqual(check_symlink_support(), (True, "Symlinks supported"))
+    
+    def test_create_link_existing(self):
+        """Test create_link succeeds and reports an existing link on rerun."""
+        from lib.symlinks import create_link
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            target = tmp_path / "target.txt"
+            target.write_text("test")
+            link = tmp_path / "nested" / "link.txt"
+            
+            success, _, _ = create_link(link, target)
+            self.assertTrue(success)
+            self.assertEqual(link.read_text(), "test")
+            
+            success, method, _ = create_link(link, target)
+            self.assertTrue(success)
+            self.assertTrue(method.startswith("existing"))
+            
+            other = tmp_path / "other.txt"
+            other.write_text("other")
+            success, _, warning = create_link(other, target)
+            self.assertFalse(success)
+            self.assertIn("already exists", warning)
+    
+    def test_present(self):
+        """Test present detects files and broken symlinks."""
+        from lib.symlinks import present, is_windows
+        import os
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            target = tmp_path / "target.txt"
+            self.assertFalse(present(target))
+            
+            target.write_text("test")
+            self.assertTrue(present(target))
+            
+            if not is_windows():
+                dangling = tmp_path / "dangling"
+                os.symlink(tmp_path / "missing", dangling)
+                self.assertTrue(present(dangling))
 
 
 class TestGitHub(unittest.TestCase):
@@ -130,6 +280,251 @@ class TestGitHub(unittest.TestCase):
         self.assertIn("## How to Test", body)
         self.assertIn("## Known Limitations", body)
         self.assertNotIn("Closes", body)  # No issue number
+    
+    def test_pr_cache_roundtrip(self):
+        """Test PR lookups are cached, including 'no PR' results, until the TTL."""
+        from lib import github
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original = github.PR_CACHE_DIR
+            github.PR_CACHE_DIR = Path(tmpdir)
+            try:
+                cache_file = github._pr_cache_file('exists', '/repo', 'feat/1', None, 'abc')
+                self.assertEqual(github._pr_cache_load(cache_file), (False, None))
+                
+                github._pr_cache_store(cache_file, None)
+                self.assertEqual(github._pr_cache_load(cache_file), (True, None))
+                self.assertEqual(github._pr_cache_load(cache_file, ttl=0), (False, None))
+                
+                github._pr_cache_clear('exists')
+                self.assertFalse(cache_file.exists())
+            finally:
+                github.PR_CACHE_DIR = original
+
+    def test_enable_branch_protection_args(self):
+        """Test the gh api fields sent for each protection option."""
+        from lib import github
+        from unittest import mock
+        import subprocess
+
+        endpoint = 'repos/{owner}/{repo}/branches/main/protection'
+        cases = (
+            (
+                dict(required_status_checks=['PR Issue Link Check']),
+                ['-F', 'enforce_admins=false',
+                 '-F', 'allow_force_pushes=false',
+                 '-F', 'allow_deletions=false',
+                 '-F', 'restrictions=null',
+                 '-F', 'required_pull_request_reviews[required_approving_review_count]=0',
+                 '-F', 'required_status_checks[strict]=false',
+                 '-f', 'required_status_checks[contexts][]=PR Issue Link Check'],
+            ),
+            (
+                dict(require_pr_reviews=False, enforce_admins=True,
+                     allow_force_pushes=True, allow_deletions=True),
+                ['-F', 'enforce_admins=true',
+                 '-F', 'allow_force_pushes=true',
+                 '-F', 'allow_deletions=true',
+                 '-F', 'restrictions=null',
+                 '-F', 'required_pull_request_reviews=null',
+                 '-F', 'required_status_checks=null'],
+            ),
+            (
+                dict(required_status_checks=['lint', 'test']),
+                ['-F', 'enforce_admins=false',
+                 '-F', 'allow_force_pushes=false',
+                 '-F', 'allow_deletions=false',
+                 '-F', 'restrictions=null',
+                 '-F', 'required_pull_request_reviews[required_approving_review_count]=0',
+                 '-F', 'required_status_checks[strict]=false',
+                 '-f', 'required_status_checks[contexts][]=lint',
+                 '-f', 'required_status_checks[contexts][]=test'],
+            ),
+        )
+        done = subprocess.CompletedProcess([], 0, stdout='{}', stderr='')
+        for kwargs, fields in cases:
+            with self.subTest(**{k: str(v) for k, v in kwargs.items()}):
+                with mock.patch.object(github, 'run_command', return_value=done) as run_command:
+                    self.assertEqual(github.enable_branch_protection('main', **kwargs), (True, None))
+                self.assertEqual(
+                    run_command.call_args[0][0],
+                    ['gh', 'api', '--method', 'PUT', endpoint] + fields
+                )
+
+        failed = subprocess.CompletedProcess([], 1, stdout='', stderr='HTTP 403: Forbidden\n')
+        with mock.patch.object(github, 'run_command', return_value=failed):
+            self.assertEqual(
+                github.enable_branch_protection('main'), (False, 'HTTP 403: Forbidden')
+            )
+
+    def test_branch_protection_lookup(self):
+        """Test an unprotected branch (404) reads as None, a protected one as its rules."""
+        from lib import github
+        from unittest import mock
+        import subprocess
+
+        missing = subprocess.CompletedProcess([], 1, stdout='', stderr='HTTP 404: Branch not protected')
+        with mock.patch.object(github, 'run_command', return_value=missing) as run_command:
+            self.assertIsNone(github.get_branch_protection('main'))
+            self.assertFalse(github.is_branch_protected('main'))
+        self.assertEqual(
+            run_command.call_args[0][0],
+            ['gh', 'api', 'repos/{owner}/{repo}/branches/main/protection']
+        )
+
+        rules = subprocess.CompletedProcess(
+            [], 0, stdout='{"enforce_admins": {"enabled": true}}', stderr=''
+        )
+        with mock.patch.object(github, 'run_command', return_value=rules):
+            self.assertEqual(
+                github.get_branch_protection('main'), {'enforce_admins': {'enabled': True}}
+            )
+            self.assertTrue(github.is_branch_protected('main'))
+
+    def test_check_admin_access(self):
+        """Test only ADMIN viewer permission counts as admin access."""
+        from lib import github
+        from unittest import mock
+        import subprocess
+
+        done = subprocess.CompletedProcess([], 0, stdout='', stderr='')
+        for parsed, expected in (
+            ({'viewerPermission': 'ADMIN'}, True),
+            ({'viewerPermission': 'WRITE'}, False),
+            (None, False),
+        ):
+            with self.subTest(parsed=parsed):
+                with mock.patch.object(github, 'run_gh', return_value=(done, parsed)):
+                    self.assertEqual(github.check_admin_access(), expected)
+
+    def test_get_repo_info_flat(self):
+        """Test get_repo_info flattens the owner login."""
+        from lib import common
+        from unittest import mock
+        import subprocess
+
+        done = subprocess.CompletedProcess([], 0, stdout='', stderr='')
+        parsed = {'owner': {'login': 'me'}, 'name': 'tool'}
+        with mock.patch.object(common, 'run_gh', return_value=(done, parsed)):
+            self.assertEqual(common.get_repo_info(), {'owner': 'me', 'name': 'tool'})
+
+
+_REMOTE_CONFIG_CASES = (
+    # Single GitHub remote
+    ("remote.origin.url git@github.com:me/tool.git\n", ("me", "tool")),
+    # Fork without a default: gh would not guess, so neither do we
+    ("remote.origin.url https://github.com/me/tool.git\n"
+     "remote.upstream.url https://github.com/org/tool.git\n", None),
+    # `gh repo set-default` marks the chosen remote
+    ("remote.origin.url https://github.com/me/tool.git\n"
+     "remote.upstream.url https://github.com/org/tool.git\n"
+     "remote.upstream.gh-resolved base\n", ("org", "tool")),
+    # Older gh releases stored OWNER/REPO
+    ("remote.origin.url https://github.com/me/tool.git\n"
+     "remote.origin.gh-resolved org/tool\n", ("org", "tool")),
+    # Not on github.com
+    ("remote.origin.url git@gitlab.com:me/tool.git\n", None),
+)
+
+
+class _FakeResponse:
+    """Minimal http.client response."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+class TestGHSession(unittest.TestCase):
+    """Test gh_session repository resolution and connection reuse."""
+
+    def _session(self):
+        from lib.gh_session import GHSession
+
+        session = GHSession()
+        session._resolved = True
+        session._token = 'token'
+        session._repo = ('me', 'tool')
+        return session
+
+    def test_repo_from_remote_config(self):
+        """Test the repository is picked the way gh picks it."""
+        from lib.gh_session import _repo_from_remote_config
+
+        for config, expected in _REMOTE_CONFIG_CASES:
+            with self.subTest(config=config):
+                self.assertEqual(_repo_from_remote_config(config), expected)
+
+    def test_gh_repo_overrides_remotes(self):
+        """Test GH_REPO wins over remotes and other hosts disable the session."""
+        from lib import gh_session
+        from unittest import mock
+        import subprocess
+
+        token = subprocess.CompletedProcess([], 0, stdout='token\n', stderr='')
+        with mock.patch.object(gh_session, 'run_command', return_value=token), \
+                mock.patch.object(gh_session, 'run_git') as run_git:
+            with mock.patch.dict('os.environ', {'GH_REPO': 'github.com/org/tool'}):
+                session = gh_session.GHSession()
+                self.assertEqual(session.repo, ('org', 'tool'))
+                self.assertTrue(session.available)
+            run_git.assert_not_called()
+
+            with mock.patch.dict('os.environ', {'GH_HOST': 'ghe.example.com'}):
+                self.assertFalse(gh_session.GHSession().available)
+
+    def test_connection_reused(self):
+        """Test queries share one connection and reopen it once if dropped."""
+        from lib import gh_session
+        from unittest import mock
+        import http.client
+
+        ok = _FakeResponse(200, b'{"data": {"ok": true}}')
+        with mock.patch.object(gh_session.http.client, 'HTTPSConnection') as connection:
+            connection.return_value.getresponse.return_value = ok
+            session = self._session()
+            self.assertEqual(session.graphql('{ ok }'), {'ok': True})
+            self.assertEqual(session.graphql('{ ok }'), {'ok': True})
+            self.assertEqual(connection.call_count, 1)
+
+            connection.return_value.getresponse.side_effect = [
+                http.client.RemoteDisconnected('closed'), ok
+            ]
+            self.assertEqual(session.graphql('{ ok }'), {'ok': True})
+            self.assertEqual(connection.call_count, 2)
+
+    def test_http_error_returns_none(self):
+        """Test a non-200 response is reported instead of parsed as data."""
+        from lib import gh_session
+        from unittest import mock
+
+        denied = _FakeResponse(401, b'{"message": "Bad credentials"}')
+        with mock.patch.object(gh_session.http.client, 'HTTPSConnection') as connection, \
+                mock.patch.object(gh_session, 'print_error') as print_error:
+            connection.return_value.getresponse.return_value = denied
+            self.assertIsNone(self._session().graphql('{ ok }'))
+            self.assertIn('Bad credentials', print_error.call_args[0][0])
+
+    def test_falls_back_to_gh(self):
+        """Test lookups spawn gh when the session is unavailable."""
+        from lib import github
+        from lib.gh_session import GHSession
+        from unittest import mock
+        import subprocess
+
+        session = GHSession()
+        session._resolved = True
+        done = subprocess.CompletedProcess([], 0, stdout='', stderr='')
+        with mock.patch.object(github, 'get_session', return_value=session), \
+                mock.patch.object(
+                    github, 'run_gh', return_value=(done, {'defaultBranchRef': {'name': 'trunk'}})
+                ) as run_gh:
+            self.assertEqual(github.get_repo_default_branch(), 'trunk')
+            self.assertEqual(run_gh.call_args[0][:2], ('repo', 'view'))
 
 
 if __name__ == '__main__':
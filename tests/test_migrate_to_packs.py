@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tests for the legacy AGENTS.md to rule pack migration script.
+
+Run with: python3 tests/test_migrate_to_packs.py
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from migrate_to_packs import (
+    create_custom_pack, detect_customizations, extract_custom_rules
+)
+
+
+SAMPLE_AGENTS_MD = """# AGENTS.md
+
+Intro text
+
+## Prime Directives
+- rule 1
+
+## My Custom Section
+custom line 1
+
+custom line 2
+## Branch Management
+- standard rule
+### Not a section
+## Tail Custom
+tail line
+"""
+
+
+class TestExtractCustomRules(unittest.TestCase):
+    """Test extraction of custom sections from AGENTS.md."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.agents_md = Path(self.tmpdir.name) / 'AGENTS.md'
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_extracts_only_custom_sections(self):
+        """Standard sections should be dropped, custom ones kept in order."""
+        self.agents_md.write_text(SAMPLE_AGENTS_MD)
+        custom = extract_custom_rules(self.agents_md)
+
+        self.assertEqual(
+            custom,
+            "## My Custom Section\ncustom line 1\n\ncustom line 2\n\n"
+            "## Tail Custom\ntail line\n"
+        )
+
+    def test_no_custom_sections(self):
+        """A file with only standard sections yields no custom content."""
+        self.agents_md.write_text("## Prime Directives\n- rule\n## Anti-Patterns\n- x\n")
+        self.assertEqual(extract_custom_rules(self.agents_md), '')
+
+    def test_standard_prefix_is_not_standard(self):
+        """Headers that merely start with a standard header are custom."""
+        self.agents_md.write_text("## Prime Directives Extra\nmine\n")
+        self.assertEqual(
+            extract_custom_rules(self.agents_md),
+            "## Prime Directives Extra\nmine\n"
+        )
+
+    def test_final_section_keeps_trailing_newline(self):
+        """The last custom section keeps the file's trailing newline, for LF and CRLF alike."""
+        cases = (
+            (b"## X\na\n", "## X\na\n"),
+            (b"## X\r\na\r\n", "## X\na\n"),
+            (b"## X\na", "## X\na"),
+            (b"## X\na\n## Prime Directives\n- rule\n", "## X\na"),
+        )
+        for raw, expected in cases:
+            with self.subTest(raw=raw):
+                self.agents_md.write_bytes(raw)
+                self.assertEqual(extract_custom_rules(self.agents_md), expected)
+
+
+class TestDetectCustomizations(unittest.TestCase):
+    """Test detection of customized AGENTS.md files."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.agents_md = Path(self.tmpdir.name) / 'AGENTS.md'
+        self.legacy_md = Path(self.tmpdir.name) / 'AGENTS.legacy.md'
+        self.legacy_md.write_text(SAMPLE_AGENTS_MD)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_identical_files(self):
+        """Identical files are not customized."""
+        self.agents_md.write_text(SAMPLE_AGENTS_MD)
+        self.assertFalse(detect_customizations(self.agents_md, self.legacy_md))
+
+    def test_surrounding_whitespace_ignored(self):
+        """Leading/trailing whitespace differences are not customizations."""
+        for padded in (
+            "\n" + SAMPLE_AGENTS_MD + "\n\n",
+            SAMPLE_AGENTS_MD + "\n" * 100,
+            " \r\n" * 2000 + SAMPLE_AGENTS_MD + "\t\n" * 3000,
+        ):
+            with self.subTest(size=len(padded)):
+                self.agents_md.write_text(padded)
+                self.assertFalse(detect_customizations(self.agents_md, self.legacy_md))
+
+    def test_modified_content(self):
+        """Edited or extended files are customized."""
+        self.agents_md.write_text(SAMPLE_AGENTS_MD.replace('rule 1', 'rule 2'))
+        self.assertTrue(detect_customizations(self.agents_md, self.legacy_md))
+
+        self.agents_md.write_text(SAMPLE_AGENTS_MD + "## Extra\n" + "x" * 200)
+        self.assertTrue(detect_customizations(self.agents_md, self.legacy_md))
+
+
+class TestCreateCustomPack(unittest.TestCase):
+    """Test creation of the custom rule pack."""
+
+    def test_pack_metadata_counts(self):
+        """pack.json should record word and character counts of the rules."""
+        content = "## Mine\nAlways  write\ttests\n\nfirst."
+        with tempfile.TemporaryDirectory() as tmpdir:
+            install_dir = Path(tmpdir)
+            self.assertTrue(create_custom_pack(install_dir, content))
+
+            custom_dir = install_dir / 'rule-packs' / 'custom'
+            with open(custom_dir / 'pack.json', 'r') as f:
+                pack = json.load(f)
+            self.assertEqual(pack['metadata']['wordCount'], len(content.split()))
+            self.assertEqual(pack['metadata']['characterCount'], len(content))
+            self.assertIn(content, (custom_dir / 'custom-rules.md').read_text())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
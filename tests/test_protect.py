@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the branch protection setup script.
+
+Run with: python3 tests/test_protect.py
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import protect
+
+
+class TestProtectMain(unittest.TestCase):
+    """Test protect.py main against stubbed GitHub helpers."""
+
+    def test_uses_flat_repo_info(self):
+        """main should read owner/name from get_repo_info's flat dict and apply protection."""
+        with mock.patch.object(sys, 'argv', ['protect.py', '--skip-action']), \
+                mock.patch.object(protect, 'check_prerequisites', return_value=True), \
+                mock.patch.object(protect, 'get_repo_info',
+                                  return_value={'owner': 'me', 'name': 'tool'}), \
+                mock.patch.object(protect, 'check_admin_access', return_value=True), \
+                mock.patch.object(protect, 'get_repo_default_branch', return_value='main'), \
+                mock.patch.object(protect, 'is_branch_protected', return_value=False), \
+                mock.patch.object(protect, 'enable_branch_protection',
+                                  return_value=(True, None)) as enable, \
+                mock.patch('builtins.input', return_value='y'), \
+                mock.patch.object(protect, 'print_success') as print_success, \
+                mock.patch.object(protect, 'print_info') as print_info:
+            protect.main()
+
+        successes = [call[0][0] for call in print_success.call_args_list]
+        infos = [call[0][0] for call in print_info.call_args_list]
+        self.assertIn("✓ Repository: me/tool", successes)
+        self.assertIn("  https://github.com/me/tool/settings/branches", infos)
+        enable.assert_called_once_with(
+            branch='main',
+            require_pr_reviews=True,
+            required_status_checks=['PR Issue Link Check'],
+            enforce_admins=False,
+            allow_force_pushes=False,
+            allow_deletions=False
+        )
+
+    def test_no_admin_access_exits(self):
+        """main should stop before touching protection without admin access."""
+        with mock.patch.object(sys, 'argv', ['protect.py', '--branch', 'main']), \
+                mock.patch.object(protect, 'check_prerequisites', return_value=True), \
+                mock.patch.object(protect, 'get_repo_info',
+                                  return_value={'owner': 'me', 'name': 'tool'}), \
+                mock.patch.object(protect, 'check_admin_access', return_value=False), \
+                mock.patch.object(protect, 'enable_branch_protection') as enable, \
+                mock.patch.object(protect, 'print_error'), \
+                mock.patch.object(protect, 'print_info'), \
+                mock.patch.object(protect, 'print_success'):
+            with self.assertRaises(SystemExit) as exit_info:
+                protect.main()
+
+        self.assertEqual(exit_info.exception.code, 1)
+        enable.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -4,11 +4,15 @@
 Run with: python3 tests/test_rule_packs.py
 """
 
+import functools
 import json
 import os
+import re
 import sys
 import unittest
 from pathlib import Path
+from types import MappingProxyType
+from typing import List, NamedTuple, Optional, Tuple
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -17,6 +21,92 @@ sys.path.insert(0, str(PROJECT_ROOT))
 PACKS_DIR = PROJECT_ROOT / 'rule-packs'
 SCHEMA_PATH = PROJECT_ROOT / 'schemas' / 'rule-pack.schema.json'
 
+# orjson is an optional speedup; both parsers accept UTF-8 bytes
+try:
+    import orjson
+    _parse_json = orjson.loads
+except ImportError:
+    _parse_json = json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pack(pack_id: str) -> dict:
+    """Parse a pack's pack.json once per test run (callers must not mutate it)."""
+    return _parse_json((PACKS_DIR / pack_id / 'pack.json').read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text(path: Path) -> str:
+    """Read a pack file once per test run."""
+    return path.read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _schema() -> dict:
+    """Parse the pack schema once per test run (callers must not mutate it)."""
+    if not SCHEMA_PATH.exists():
+        raise AssertionError(f"Schema not found at {SCHEMA_PATH}")
+    try:
+        return _parse_json(SCHEMA_PATH.read_bytes())
+    except ValueError as e:
+        raise AssertionError(f"Schema is not valid JSON: {e}") from e
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_properties() -> dict:
+    """Top-level property definitions from the schema."""
+    return _schema().get('properties', {})
+
+
+@functools.lru_cache(maxsize=None)
+def _id_re() -> re.Pattern:
+    """Compiled pattern for pack ids."""
+    return re.compile(_schema_properties()['id']['pattern'])
+
+
+@functools.lru_cache(maxsize=None)
+def _version_re() -> re.Pattern:
+    """Compiled pattern for pack versions."""
+    return re.compile(_schema_properties()['version']['pattern'])
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_required() -> Tuple[str, ...]:
+    """Fields the schema requires in pack metadata."""
+    return tuple(_schema_properties().get('metadata', {}).get('required', []))
+
+
+@functools.lru_cache(maxsize=None)
+def _files_min_items() -> int:
+    """Minimum number of files the schema requires per pack."""
+    return _schema_properties().get('files', {}).get('minItems', 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _pack_dirs() -> Tuple[Path, ...]:
+    """Pack directories (those with a pack.json), scanned once."""
+    if not PACKS_DIR.exists():
+        return ()
+    return tuple(p for p in PACKS_DIR.iterdir() if p.is_dir() and (p / 'pack.json').exists())
+
+
+@functools.lru_cache(maxsize=None)
+def _pack_ids() -> Tuple[str, ...]:
+    """Ids of the packs found by _pack_dirs()."""
+    return tuple(p.name for p in _pack_dirs())
+
+
+@functools.lru_cache(maxsize=None)
+def _deps() -> MappingProxyType:
+    """Read-only dependency graph: pack id -> tuple of dependency ids."""
+    return MappingProxyType({
+        pack_id: tuple(_load_pack(pack_id).get('dependencies', [])) for pack_id in _pack_ids()
+    })
+
+
+# Whitespace-delimited words, counted the same way as str.split()
+_WORD_RE = re.compile(r'\S+')
+
 
 class TestRulePackSchema(unittest.TestCase):
     """Test pack.json schema validation."""
@@ -27,139 +117,64 @@ class TestRulePackSchema(unittest.TestCase):
 
     def test_schema_valid_json(self):
         """Schema should be valid JSON."""
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
+        schema = _schema()
         self.assertIn('$schema', schema)
         self.assertIn('properties', schema)
 
     def test_schema_required_fields(self):
         """Schema should define required fields."""
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
-        required = schema.get('required', [])
+        required = _schema().get('required', [])
         expected = ['id', 'name', 'version', 'description', 'files', 'metadata']
         for field in expected:
             self.assertIn(field, required, f"Missing required field: {field}")
 
 
-class TestCorePack(unittest.TestCase):
-    """Test the core rule pack."""
+class _PackSpec(NamedTuple):
+    """Expected properties of a shipped rule pack."""
+    id: str
+    category: str
+    dependencies: Tuple[str, ...]  # Required dependencies; () means none at all
+    target_agents: Optional[List[str]]  # Exact targetAgents, or None to skip
+    tags: Tuple[str, ...]  # Tags that must be present
 
-    def setUp(self):
-        self.pack_dir = PACKS_DIR / 'core'
-        self.pack_json = self.pack_dir / 'pack.json'
 
-    def test_pack_exists(self):
-        """Core pack should exist."""
-        self.assertTrue(self.pack_dir.exists())
-        self.assertTrue(self.pack_json.exists())
+_PACK_SPECS = (
+    _PackSpec('core', 'universal', (), ['*'], ()),
+    _PackSpec('github-hygiene', 'vcs', ('core',), None, ('github',)),
+    _PackSpec('azure-devops', 'vcs', ('core',), None, ('azure-devops',)),
+)
 
-    def test_pack_json_valid(self):
-        """pack.json should be valid JSON."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertEqual(pack['id'], 'core')
-        self.assertEqual(pack['metadata']['category'], 'universal')
 
-    def test_all_files_exist(self):
-        """All referenced files should exist."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        for file in pack['files']:
-            file_path = self.pack_dir / file
-            self.assertTrue(file_path.exists(), f"Missing file: {file}")
-
-    def test_no_dependencies(self):
-        """Core pack should have no dependencies."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertEqual(pack['dependencies'], [])
-
-    def test_targets_all_agents(self):
-        """Core pack should target all agents."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertEqual(pack['targetAgents'], ['*'])
-
-
-class TestGitHubHygienePack(unittest.TestCase):
-    """Test the GitHub hygiene rule pack."""
-
-    def setUp(self):
-        self.pack_dir = PACKS_DIR / 'github-hygiene'
-        self.pack_json = self.pack_dir / 'pack.json'
-
-    def test_pack_exists(self):
-        """GitHub hygiene pack should exist."""
-        self.assertTrue(self.pack_dir.exists())
-        self.assertTrue(self.pack_json.exists())
-
-    def test_pack_json_valid(self):
-        """pack.json should be valid JSON."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertEqual(pack['id'], 'github-hygiene')
-        self.assertEqual(pack['metadata']['category'], 'vcs')
-
-    def test_all_files_exist(self):
-        """All referenced files should exist."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        for file in pack['files']:
-            file_path = self.pack_dir / file
-            self.assertTrue(file_path.exists(), f"Missing file: {file}")
-
-    def test_depends_on_core(self):
-        """GitHub hygiene pack should depend on core."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertIn('core', pack['dependencies'])
-
-    def test_has_github_tag(self):
-        """GitHub hygiene pack should have github tag."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertIn('github', pack['metadata']['tags'])
-
-
-class TestAzureDevOpsPack(unittest.TestCase):
-    """Test the Azure DevOps rule pack."""
-
-    def setUp(self):
-        self.pack_dir = PACKS_DIR / 'azure-devops'
-        self.pack_json = self.pack_dir / 'pack.json'
-
-    def test_pack_exists(self):
-        """Azure DevOps pack should exist."""
-        self.assertTrue(self.pack_dir.exists())
-        self.assertTrue(self.pack_json.exists())
-
-    def test_pack_json_valid(self):
-        """pack.json should be valid JSON."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertEqual(pack['id'], 'azure-devops')
-        self.assertEqual(pack['metadata']['category'], 'vcs')
-
-    def test_all_files_exist(self):
-        """All referenced files should exist."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        for file in pack['files']:
-            file_path = self.pack_dir / file
-            self.assertTrue(file_path.exists(), f"Missing file: {file}")
+class TestPacks(unittest.TestCase):
+    """Test the shipped rule packs against their expected properties."""
 
-    def test_depends_on_core(self):
-        """Azure DevOps pack should depend on core."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertIn('core', pack['dependencies'])
+    def test_packs(self):
+        """Each pack should exist, reference real files, and declare expected metadata."""
+        for spec in _PACK_SPECS:
+            with self.subTest(pack=spec.id):
+                pack_dir = PACKS_DIR / spec.id
+                self.assertTrue(pack_dir.exists())
+                self.assertTrue((pack_dir / 'pack.json').exists())
 
-    def test_has_azure_devops_tag(self):
-        """Azure DevOps pack should have azure-devops tag."""
-        with open(self.pack_json, 'r') as f:
-            pack = json.load(f)
-        self.assertIn('azure-devops', pack['metadata']['tags'])
+                pack = _load_pack(spec.id)
+                self.assertEqual(pack['id'], spec.id)
+                self.assertEqual(pack['metadata']['category'], spec.category)
+
+                for file in pack['files']:
+                    self.assertTrue((pack_dir / file).exists(), f"Missing file: {file}")
+
+                self.assertIsInstance(pack['dependencies'], list)
+                if spec.dependencies:
+                    for dep_id in spec.dependencies:
+                        self.assertIn(dep_id, _deps()[spec.id])
+                else:
+                    self.assertEqual(_deps()[spec.id], ())
+
+                if spec.target_agents is not None:
+                    self.assertEqual(pack['targetAgents'], spec.target_agents)
+
+                for tag in spec.tags:
+                    self.assertIn(tag, pack['metadata']['tags'])
 
 
 class TestDependencyResolution(unittest.TestCase):
@@ -170,37 +185,33 @@ class TestDependencyResolution(unittest.TestCase):
         if not PACKS_DIR.exists():
             self.skipTest("Packs directory not found")
 
-        for pack_dir in PACKS_DIR.iterdir():
-            if not pack_dir.is_dir():
-                continue
-            pack_json = pack_dir / 'pack.json'
-            if not pack_json.exists():
-                continue
-
-            with open(pack_json, 'r') as f:
-                pack = json.load(f)
+        self._check_no_cycle(_deps())
 
-            # Check each dependency exists and doesn't create a cycle
-            visited = set()
-            self._check_no_cycle(pack['id'], visited)
+    def _check_no_cycle(self, graph):
+        """Iterative three-color DFS; each pack is visited once."""
+        white, gray, black = 0, 1, 2
+        state = {}
 
-    def _check_no_cycle(self, pack_id: str, visited: set, path: list = None):
-        """Recursively check for cycles."""
-        if path is None:
-            path = []
-
-        if pack_id in visited:
-            self.fail(f"Circular dependency detected: {' -> '.join(path + [pack_id])}")
-
-        visited.add(pack_id)
-        path.append(pack_id)
-
-        pack_json = PACKS_DIR / pack_id / 'pack.json'
-        if pack_json.exists():
-            with open(pack_json, 'r') as f:
-                pack = json.load(f)
-            for dep_id in pack.get('dependencies', []):
-                self._check_no_cycle(dep_id, visited.copy(), path.copy())
+        for root in graph:
+            if state.get(root, white) != white:
+                continue
+            state[root] = gray
+            path = [root]
+            stack = [iter(graph[root])]
+            while stack:
+                dep_id = next(stack[-1], None)
+                if dep_id is None:
+                    stack.pop()
+                    state[path.pop()] = black
+                    continue
+                dep_state = state.get(dep_id, white)
+                if dep_state == gray:
+                    self.fail(f"Circular dependency detected: {' -> '.join(path + [dep_id])}")
+                if dep_state == white:
+                    # Unknown packs (no pack.json) have no outgoing edges
+                    state[dep_id] = gray
+                    path.append(dep_id)
+                    stack.append(iter(graph.get(dep_id, ())))
 
 
 class TestPackContent(unittest.TestCase):
@@ -210,21 +221,21 @@ class TestPackContent(unittest.TestCase):
         """Core pack should have prime directives."""
         prime_directives = PACKS_DIR / 'core' / 'prime-directives.md'
         self.assertTrue(prime_directives.exists())
-        content = prime_directives.read_text()
+        content = _read_text(prime_directives)
         self.assertIn('NEVER', content)  # Prime directives use strong language
 
     def test_github_has_issue_first(self):
         """GitHub hygiene pack should have issue-first rules."""
         issue_first = PACKS_DIR / 'github-hygiene' / 'issue-first.md'
         self.assertTrue(issue_first.exists())
-        content = issue_first.read_text()
+        content = _read_text(issue_first)
         self.assertIn('issue', content.lower())
 
     def test_azure_has_work_item_first(self):
         """Azure DevOps pack should have work-item-first rules."""
         work_item_first = PACKS_DIR / 'azure-devops' / 'work-item-first.md'
         self.assertTrue(work_item_first.exists())
-        content = work_item_first.read_text()
+        content = _read_text(work_item_first)
         self.assertIn('work item', content.lower())
 
 
@@ -233,9 +244,7 @@ class TestCharacterCounts(unittest.TestCase):
 
     def _get_actual_counts(self, pack_dir: Path) -> tuple:
         """Get actual word and character counts for a pack."""
-        pack_json = pack_dir / 'pack.json'
-        with open(pack_json, 'r') as f:
-            pack = json.load(f)
+        pack = _load_pack(pack_dir.name)
 
         total_chars = 0
         total_words = 0
@@ -243,17 +252,16 @@ class TestCharacterCounts(unittest.TestCase):
         for file in pack['files']:
             file_path = pack_dir / file
             if file_path.exists():
-                content = file_path.read_text()
+                content = _read_text(file_path)
                 total_chars += len(content)
-                total_words += len(content.split())
+                total_words += sum(1 for _ in _WORD_RE.finditer(content))
 
         return total_words, total_chars
 
     def test_core_counts_reasonable(self):
         """Core pack counts should be within 50% of declared."""
         pack_dir = PACKS_DIR / 'core'
-        with open(pack_dir / 'pack.json', 'r') as f:
-            pack = json.load(f)
+        pack = _load_pack('core')
 
         actual_words, actual_chars = self._get_actual_counts(pack_dir)
         declared_words = pack['metadata']['wordCount']
@@ -269,120 +277,52 @@ class TestCharacterCounts(unittest.TestCase):
 class TestSchemaValidation(unittest.TestCase):
     """Test that pack.json files are validated against the JSON schema."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.invalid_pack_dir = PACKS_DIR / 'test-invalid-schema'
-        self._cleanup()
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self._cleanup()
-
-    def _cleanup(self):
-        """Remove test pack directory if it exists."""
-        import shutil
-        if self.invalid_pack_dir.exists():
-            shutil.rmtree(self.invalid_pack_dir)
-
-    def _create_invalid_pack(self, pack_data: dict):
-        """Create a pack with the given data for testing."""
-        self.invalid_pack_dir.mkdir(parents=True, exist_ok=True)
-        pack_json = self.invalid_pack_dir / 'pack.json'
-        with open(pack_json, 'w') as f:
-            json.dump(pack_data, f, indent=2)
-
     def test_schema_rejects_invalid_id_format(self):
         """Schema should reject IDs that aren't lowercase kebab-case."""
-        # This test verifies that the schema pattern ^[a-z][a-z0-9-]*$ is enforced
-        invalid_pack = {
-            'id': 'UPPERCASE_ID',  # Invalid: uppercase
-            'name': 'Test Pack',
-            'version': '1.0.0',
-            'description': 'Test',
-            'dependencies': [],
-            'targetAgents': ['*'],
-            'files': ['test.md'],
-            'metadata': {
-                'wordCount': 100,
-                'characterCount': 500,
-                'category': 'universal',
-                'tags': []
-            }
-        }
-        self._create_invalid_pack(invalid_pack)
-        
-        # The pack should fail validation due to invalid ID format
-        # This test documents the expected behavior - actual validation
-        # happens in TypeScript via AJV
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
-        
-        id_pattern = schema['properties']['id']['pattern']
-        import re
+        # This test verifies that the schema pattern ^[a-z][a-z0-9-]*$ is enforced.
+        # It documents the expected behavior - actual validation of pack.json
+        # files happens in TypeScript via AJV
+        id_re = _id_re()
+        invalid_id = 'UPPERCASE_ID'
         self.assertIsNone(
-            re.match(id_pattern, invalid_pack['id']),
-            f"ID '{invalid_pack['id']}' should not match pattern '{id_pattern}'"
+            id_re.match(invalid_id),
+            f"ID '{invalid_id}' should not match pattern '{id_re.pattern}'"
         )
 
     def test_schema_rejects_invalid_version_format(self):
         """Schema should reject versions that aren't semver."""
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
-        
-        version_pattern = schema['properties']['version']['pattern']
-        import re
-        
+        version_re = _version_re()
+
         # Valid versions
-        self.assertIsNotNone(re.match(version_pattern, '1.0.0'))
-        self.assertIsNotNone(re.match(version_pattern, '2.1.0-beta'))
+        self.assertIsNotNone(version_re.match('1.0.0'))
+        self.assertIsNotNone(version_re.match('2.1.0-beta'))
         
         # Invalid versions
-        self.assertIsNone(re.match(version_pattern, 'not-semver'))
-        self.assertIsNone(re.match(version_pattern, '1.0'))
-        self.assertIsNone(re.match(version_pattern, 'v1.0.0'))
+        self.assertIsNone(version_re.match('not-semver'))
+        self.assertIsNone(version_re.match('1.0'))
+        self.assertIsNone(version_re.match('v1.0.0'))
 
     def test_schema_requires_metadata_category(self):
         """Schema should require category in metadata."""
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
-        
-        metadata_required = schema['properties']['metadata']['required']
-        self.assertIn('category', metadata_required)
+        self.assertIn('category', _metadata_required())
 
     def test_schema_requires_files_non_empty(self):
         """Schema should require at least one file."""
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
-        
-        files_min_items = schema['properties']['files'].get('minItems', 0)
-        self.assertEqual(files_min_items, 1, "Schema should require minItems: 1 for files")
+        self.assertEqual(_files_min_items(), 1, "Schema should require minItems: 1 for files")
 
     def test_valid_packs_match_schema_patterns(self):
         """All existing packs should have valid IDs and versions."""
-        import re
-        
-        with open(SCHEMA_PATH, 'r') as f:
-            schema = json.load(f)
-        
-        id_pattern = schema['properties']['id']['pattern']
-        version_pattern = schema['properties']['version']['pattern']
-        
-        for pack_dir in PACKS_DIR.iterdir():
-            if not pack_dir.is_dir():
-                continue
-            pack_json = pack_dir / 'pack.json'
-            if not pack_json.exists():
-                continue
-            
-            with open(pack_json, 'r') as f:
-                pack = json.load(f)
+        id_re = _id_re()
+        version_re = _version_re()
+        for pack_dir in _pack_dirs():
+            pack = _load_pack(pack_dir.name)
             
             self.assertIsNotNone(
-                re.match(id_pattern, pack['id']),
+                id_re.match(pack['id']),
                 f"Pack {pack['id']} has invalid ID format"
             )
             self.assertIsNotNone(
-                re.match(version_pattern, pack['version']),
+                version_re.match(pack['version']),
                 f"Pack {pack['id']} has invalid version format: {pack['version']}"
             )
 
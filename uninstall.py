@@ -6,7 +6,8 @@ and .github/ templates. Also cleans up global agent command symlinks
 installed by build_commands.py.
 """
 
-import shutil
+import os
+import stat
 import sys
 from pathlib import Path
 
@@ -17,25 +18,67 @@ from lib.common import (
     colors, print_error, print_success, print_warning, print_info,
     check_git_repo, get_repo_root
 )
-from lib.symlinks import remove_link
+
+# Global agent command links installed by build_commands.py, resolved once
+HOME = Path.home()
+GLOBAL_AGENT_LINKS = {
+    "Cursor commands": HOME / '.cursor' / 'commands',
+    "Claude commands": HOME / '.claude' / 'commands',
+    "Codex prompts": HOME / '.codex' / 'prompts',
+    "Gemini commands": HOME / '.gemini' / 'commands',
+}
+
+
+def _probe_link(path: Path) -> str:
+    """Classify a global agent path.
+
+    Returns:
+        'symlink', 'other', or 'missing'
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except OSError:
+        return 'missing'
+    return 'symlink' if stat.S_ISLNK(mode) else 'other'
+
+
+def _is_empty_dir(path: Path, ignore: tuple = ()) -> bool:
+    """Check whether a directory has no entries besides the `ignore` names.
+    
+    Stops scanning at the first entry that is not ignored.
+    """
+    with os.scandir(path) as entries:
+        return all(entry.name in ignore for entry in entries)
+
+
+def _only_markdown_files(path: Path) -> bool:
+    """Check whether a real (non-symlinked) directory holds only .md files.
+    
+    Returns False for an empty directory. Stops at the first other entry.
+    """
+    if path.is_symlink():
+        return False
+    found = False
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not (entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)):
+                return False
+            found = True
+    return found
 
 
 def remove_global_agent_links():
     """Remove global agent command symlinks created by build_commands.py."""
-    targets = {
-        "Cursor commands": Path.home() / '.cursor' / 'commands',
-        "Claude commands": Path.home() / '.claude' / 'commands',
-        "Codex prompts": Path.home() / '.codex' / 'prompts',
-        "Gemini commands": Path.home() / '.gemini' / 'commands',
-    }
-
-    for label, path in targets.items():
-        if path.is_symlink():
+    from lib.symlinks import remove_link
+    
+    for label, path in GLOBAL_AGENT_LINKS.items():
+        kind = _probe_link(path)
+        if kind == 'symlink':
             if remove_link(path):
                 print_success(f"✓ Removed {label}: {path}")
             else:
                 print_warning(f"⚠  Could not remove {label}: {path}")
-        elif path.exists():
+        elif kind == 'other':
             print_warning(f"⊘ Skipped {label} (not a symlink): {path}")
 
 
@@ -72,20 +115,30 @@ def main():
         print("Cancelled")
         sys.exit(0)
     
+    # Only needed once removal actually starts
+    import shutil
+    from lib.symlinks import present, remove_link
+    
     # Remove Cursor rules
     cursor_rules = repo_root / '.cursor' / 'rules' / 'agents-workflow'
-    if cursor_rules.exists():
+    try:
         shutil.rmtree(cursor_rules)
+    except FileNotFoundError:
+        pass
+    else:
         print_success("✓ Removed .cursor/rules/agents-workflow/")
     
     # Remove .agents/commands symlink
     agents_commands = repo_root / '.agents' / 'commands'
-    if agents_commands.exists() or agents_commands.is_symlink():
+    if present(agents_commands):
         if remove_link(agents_commands):
             # Remove .agents directory if empty
             agents_dir = repo_root / '.agents'
-            if agents_dir.exists() and not any(agents_dir.iterdir()):
-                agents_dir.rmdir()
+            try:
+                if _is_empty_dir(agents_dir):
+                    agents_dir.rmdir()
+            except FileNotFoundError:
+                pass
             print_success("✓ Removed .agents/commands")
         else:
             print_warning("⚠  Could not remove .agents/commands")
@@ -93,26 +146,35 @@ def main():
     # Remove cursor command wrappers
     cursor_commands = repo_root / '.cursor' / 'commands'
     if cursor_commands.exists():
-        # Remove only .md files
-        removed = False
-        for md_file in cursor_commands.glob('*.md'):
-            md_file.unlink()
-            removed = True
-        
-        if removed:
+        # Fast path: a real directory holding only .md files goes in one rmtree
+        if _only_markdown_files(cursor_commands):
+            shutil.rmtree(cursor_commands)
             print_success("✓ Removed .cursor/commands/*.md")
-        
-        # Remove commands directory if empty
-        if not any(cursor_commands.iterdir()):
-            cursor_commands.rmdir()
             print_success("✓ Removed empty .cursor/commands/")
+        else:
+            # Remove only .md files
+            removed = False
+            for md_file in cursor_commands.glob('*.md'):
+                md_file.unlink()
+                removed = True
+            
+            if removed:
+                print_success("✓ Removed .cursor/commands/*.md")
+            
+            # Remove commands directory if empty
+            if _is_empty_dir(cursor_commands):
+                cursor_commands.rmdir()
+                print_success("✓ Removed empty .cursor/commands/")
     
     # Remove .issue_screenshots if empty
     screenshots_dir = repo_root / '.issue_screenshots'
-    if screenshots_dir.exists():
-        contents = list(screenshots_dir.iterdir())
+    try:
         # Check if empty or only contains .gitkeep
-        if not contents or (len(contents) == 1 and contents[0].name == '.gitkeep'):
+        screenshots_empty = _is_empty_dir(screenshots_dir, ignore=('.gitkeep',))
+    except FileNotFoundError:
+        screenshots_empty = None
+    if screenshots_empty is not None:
+        if screenshots_empty:
             shutil.rmtree(screenshots_dir)
             print_success("✓ Removed .issue_screenshots/ (was empty)")
         else: